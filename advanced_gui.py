@@ -1,11 +1,40 @@
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import filedialog, messagebox
+import asyncio
+import queue
+import subprocess
+import sys
 import threading
+import time
 import os
-from xml_data_reader import XmlDataReader
-from excel_exporter import ExcelExporter
-import webbrowser
+# XmlDataReader, ExcelExporter (openpyxl/pandas behind them) and
+# webbrowser are imported lazily inside the methods that need them so
+# the window appears before the conversion stack loads
+
+# Static UI text built once at import time instead of per radio-click
+_EXPORT_DESCRIPTIONS = {
+    "selected": "📊 Selected Parameters: Exports 15 key cardiopulmonary parameters including VO2/kg at MFO, AT, RC, and Max phases. Perfect for focused clinical analysis and research.",
+    "max": "📈 Max Values Only: Exports maximum values for all parameters. Simplified dataset ideal for peak performance analysis and quick assessments.",
+    "complete": "📋 Complete Dataset: Exports all measurement phases (Rest, Warmup, MFO, AT, RC, Max, Predicted, etc.). Comprehensive data for detailed research and analysis.",
+    "custom": "⚙️ Custom Parameters: Choose specific parameters and phases to export. Tailored datasets for specialized analysis and research requirements."
+}
+
+# Output filename suffix per export type for the conversion worker
+_EXPORT_SUFFIX = {
+    "selected": "_selected_parameters",
+    "max": "_max_only",
+    "complete": "_complete",
+    "custom": "_custom_parameters"
+}
+
+# Default output filename templates per export type
+_DEFAULT_NAME_FMT = {
+    "selected": "{}_selected_parameters.xlsx",
+    "max": "{}_max_values.xlsx",
+    "complete": "{}_complete_dataset.xlsx",
+    "custom": "{}_custom_parameters.xlsx"
+}
 
 class AdvancedCosmedGUI:
     """
@@ -39,12 +68,51 @@ class AdvancedCosmedGUI:
         self.available_parameters: list = []  # Will be populated after scanning
         self.custom_parameters: dict = {}  # Dictionary: {param_name: [phases]}
         self.available_phases: list = ['Value', 'Rest', 'Warmup', 'MFO', 'AT', 'RC', 'Max', 'Pred', 'PercPred', 'Normal', 'Class']
+        # Sampled parameter lists keyed by (folder, file count, newest
+        # sampled mtime) so rescanning an unchanged folder is free
+        self._param_cache: dict = {}
+        self._desc_after_id = None  # pending debounced export-type update
+        # One XmlDataReader reused across scan and convert, rebuilt only
+        # when the input folder changes
+        self._reader = None
+        self._reader_folder = None
+        self._last_progress_t = 0.0  # throttles progress-bar redraws
+        # Worker threads put ('status', text) / ('progress', value)
+        # messages here; a periodic Tk callback drains them in one go
+        # instead of scheduling an after(0) event per update
+        self._ui_queue: queue.Queue = queue.Queue()
+        # Last parsed dataset keyed by (folder, per-file mtimes): re-running
+        # the conversion with a different export type skips parsing
+        # entirely. Single entry so only one dataset is ever held.
+        self._parse_cache: dict = {}
+        self._help_window = None  # cached Help Toplevel, hidden on close
+        self._exists_cache = (None, False)  # (folder, isdir) for update_ui_state
+        self._ui_state_after_id = None  # pending debounced state refresh
+
+        # Background asyncio loop on its own thread for long-running
+        # conversions; widget updates are always marshalled back onto the
+        # Tk thread via window.after, never made from the loop thread
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
         
         # Create UI
         self.create_widgets()
         self.update_ui_state()
         
     def create_widgets(self):
+        # One Tk font resource per style, shared across widgets, instead
+        # of a fresh CTkFont (and Tcl 'font create') per widget
+        self._fonts = {
+            "title": ctk.CTkFont(size=28, weight="bold"),
+            "logo": ctk.CTkFont(size=24, weight="bold"),
+            "dialog_title": ctk.CTkFont(size=18, weight="bold"),
+            "section": ctk.CTkFont(size=16, weight="bold"),
+            "button": ctk.CTkFont(size=14, weight="bold"),
+            "body": ctk.CTkFont(size=13),
+            "small": ctk.CTkFont(size=12),
+            "mono": ctk.CTkFont(family="Consolas", size=11)
+        }
+
         # Create sidebar
         self.create_sidebar()
         
@@ -64,7 +132,7 @@ class AdvancedCosmedGUI:
         self.logo_label = ctk.CTkLabel(
             self.sidebar_frame, 
             text="🫁 COSMED\nConverter", 
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self._fonts["logo"]
         )
         self.logo_label.grid(row=0, column=0, padx=20, pady=(20, 30))
         
@@ -75,7 +143,7 @@ class AdvancedCosmedGUI:
         self.export_title = ctk.CTkLabel(
             self.export_frame, 
             text="Export Type", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._fonts["section"]
         )
         self.export_title.pack(pady=(0, 10))
         
@@ -134,7 +202,7 @@ class AdvancedCosmedGUI:
         self.settings_title = ctk.CTkLabel(
             self.settings_frame, 
             text="Settings", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._fonts["section"]
         )
         self.settings_title.pack(pady=(0, 10))
         
@@ -203,7 +271,7 @@ class AdvancedCosmedGUI:
         self.title_label = ctk.CTkLabel(
             self.main_frame, 
             text="COSMED XML to Excel Converter",
-            font=ctk.CTkFont(size=28, weight="bold")
+            font=self._fonts["title"]
         )
         self.title_label.grid(row=0, column=0, columnspan=3, pady=(20, 30))
         
@@ -215,7 +283,7 @@ class AdvancedCosmedGUI:
         self.input_title = ctk.CTkLabel(
             self.input_frame, 
             text="📁 Input Folder", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._fonts["section"]
         )
         self.input_title.grid(row=0, column=0, columnspan=3, padx=20, pady=(15, 10), sticky="w")
         
@@ -244,7 +312,7 @@ class AdvancedCosmedGUI:
         self.output_title = ctk.CTkLabel(
             self.output_frame, 
             text="💾 Output File", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._fonts["section"]
         )
         self.output_title.grid(row=0, column=0, columnspan=3, padx=20, pady=(15, 10), sticky="w")
         
@@ -274,7 +342,7 @@ class AdvancedCosmedGUI:
             text=self.get_export_description("selected"),
             wraplength=600,
             justify="left",
-            font=ctk.CTkFont(size=13)
+            font=self._fonts["body"]
         )
         self.description_label.pack(padx=20, pady=15)
         
@@ -287,14 +355,14 @@ class AdvancedCosmedGUI:
         self.file_title = ctk.CTkLabel(
             self.file_section, 
             text="📄 XML Files Found", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._fonts["section"]
         )
         self.file_title.grid(row=0, column=0, padx=20, pady=(15, 5), sticky="w")
         
         self.file_count_label = ctk.CTkLabel(
             self.file_section, 
             text="No files scanned yet",
-            font=ctk.CTkFont(size=12)
+            font=self._fonts["small"]
         )
         self.file_count_label.grid(row=1, column=0, padx=20, pady=(0, 10), sticky="w")
         
@@ -304,8 +372,26 @@ class AdvancedCosmedGUI:
         self.file_text_frame.grid_columnconfigure(0, weight=1)
         self.file_text_frame.grid_rowconfigure(0, weight=1)
         
-        self.file_list_text = ctk.CTkTextbox(self.file_text_frame, height=200, font=ctk.CTkFont(family="Consolas", size=11))
+        self.file_list_text = ctk.CTkTextbox(self.file_text_frame, height=200, font=self._fonts["mono"])
         self.file_list_text.grid(row=0, column=0, sticky="nsew")
+
+        # Tune the underlying tk.Text for bulk report dumps: no undo
+        # stack growing per insert and no wrap re-layout of long paths.
+        # The widget is display-only, so it stays disabled outside of
+        # _set_file_list_text.
+        try:
+            self.file_list_text._textbox.configure(undo=False, autoseparators=False, wrap="none")
+        except AttributeError:
+            pass  # internal textbox attribute not available
+        self.file_list_text.configure(state="disabled")
+
+    def _set_file_list_text(self, text):
+        """Replace the file list content with a single bulk insert"""
+        self.file_list_text.configure(state="normal")
+        self.file_list_text.delete("0.0", "end")
+        if text:
+            self.file_list_text.insert("0.0", text)
+        self.file_list_text.configure(state="disabled")
     
     def create_bottom_panel(self):
         # Control buttons frame
@@ -319,7 +405,7 @@ class AdvancedCosmedGUI:
             text="🔍 Scan Folder",
             command=self.scan_folder,
             height=45,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._fonts["button"]
         )
         self.scan_button.grid(row=0, column=0, padx=10, pady=15, sticky="ew")
         
@@ -329,7 +415,7 @@ class AdvancedCosmedGUI:
             text="⚡ Convert to Excel",
             command=self.process_files,
             height=45,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._fonts["button"],
             fg_color=("gray70", "gray30"),
             state="disabled"
         )
@@ -341,7 +427,7 @@ class AdvancedCosmedGUI:
             text="🗑️ Clear All",
             command=self.clear_all,
             height=45,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._fonts["button"]
         )
         self.clear_button.grid(row=0, column=2, padx=10, pady=15, sticky="ew")
         
@@ -359,20 +445,22 @@ class AdvancedCosmedGUI:
         self.status_label = ctk.CTkLabel(
             self.status_frame, 
             textvariable=self.status_var,
-            font=ctk.CTkFont(size=13)
+            font=self._fonts["body"]
         )
         self.status_label.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="w")
     
     def get_export_description(self, export_type):
-        descriptions = {
-            "selected": "📊 Selected Parameters: Exports 15 key cardiopulmonary parameters including VO2/kg at MFO, AT, RC, and Max phases. Perfect for focused clinical analysis and research.",
-            "max": "📈 Max Values Only: Exports maximum values for all parameters. Simplified dataset ideal for peak performance analysis and quick assessments.",
-            "complete": "📋 Complete Dataset: Exports all measurement phases (Rest, Warmup, MFO, AT, RC, Max, Predicted, etc.). Comprehensive data for detailed research and analysis.",
-            "custom": "⚙️ Custom Parameters: Choose specific parameters and phases to export. Tailored datasets for specialized analysis and research requirements."
-        }
-        return descriptions.get(export_type, "")
+        return _EXPORT_DESCRIPTIONS.get(export_type, "")
     
     def on_export_type_change(self):
+        # Debounce: rapid toggling through the radio buttons collapses
+        # into a single relayout 50ms after the last change
+        if self._desc_after_id is not None:
+            self.window.after_cancel(self._desc_after_id)
+        self._desc_after_id = self.window.after(50, self._apply_export_type_change)
+
+    def _apply_export_type_change(self):
+        self._desc_after_id = None
         export_type = self.export_type.get()
         self.description_label.configure(text=self.get_export_description(export_type))
         
@@ -381,19 +469,15 @@ class AdvancedCosmedGUI:
             self.custom_params_button.configure(state="normal")
         else:
             self.custom_params_button.configure(state="disabled")
-        
-        # Update default filename if output is not set
-        if not self.output_file.get() and self.input_folder.get():
-            folder_name = os.path.basename(self.input_folder.get()) or "cosmed_data"
-            default_names = {
-                "selected": f"{folder_name}_selected_parameters.xlsx",
-                "max": f"{folder_name}_max_values.xlsx",
-                "complete": f"{folder_name}_complete_dataset.xlsx",
-                "custom": f"{folder_name}_custom_parameters.xlsx"
-            }
+
+        # Update default filename if output is not set; each Tk variable
+        # is read once (every .get() is a Tcl round-trip)
+        input_folder = self.input_folder.get()
+        if input_folder and not self.output_file.get():
+            folder_name = os.path.basename(input_folder) or "cosmed_data"
             default_path = os.path.join(
-                os.path.dirname(self.input_folder.get()) or os.getcwd(),
-                default_names[export_type]
+                os.path.dirname(input_folder) or os.getcwd(),
+                _DEFAULT_NAME_FMT[export_type].format(folder_name)
             )
             self.output_file.set(default_path)
     
@@ -404,7 +488,7 @@ class AdvancedCosmedGUI:
         )
         if folder:
             self.input_folder.set(folder)
-            self.file_list_text.delete("0.0", "end")
+            self._set_file_list_text("")
             self.xml_files = []
             self.update_ui_state()
             # Auto-suggest output filename
@@ -412,8 +496,9 @@ class AdvancedCosmedGUI:
     
     def browse_output_file(self):
         initial_name = ""
-        if self.input_folder.get():
-            folder_name = os.path.basename(self.input_folder.get()) or "cosmed_data"
+        input_folder = self.input_folder.get()
+        if input_folder:
+            folder_name = os.path.basename(input_folder) or "cosmed_data"
             export_type = self.export_type.get()
             initial_name = f"{folder_name}_{export_type}_export.xlsx"
         
@@ -432,103 +517,205 @@ class AdvancedCosmedGUI:
         if not folder or not os.path.exists(folder):
             messagebox.showerror("Error", "Please select a valid input folder.")
             return
-        
+
         self.status_var.set("🔍 Scanning for XML files...")
-        self.file_list_text.delete("0.0", "end")
-        self.progress_bar.set(0.2)
-        
-        # Find XML files
-        self.xml_files = []
+        self._set_file_list_text("")
+        self._set_progress(0.2)
+        self.scan_button.configure(state="disabled")
+
+        # Walking a large tree (or a network share) can stall for seconds;
+        # run the scan on a worker thread like process_files does and
+        # marshal results back onto the Tk event loop
+        thread = threading.Thread(target=self._scan_folder_thread, args=(folder,))
+        thread.daemon = True
+        thread.start()
+
+    def _scan_folder_thread(self, folder):
+        """Scan for XML files off the UI thread; never touches widgets"""
+        xml_files = []
+        scan_entries = []  # (path, filename, relative path) per file
+        available_parameters = []
+        error = None
+
         try:
-            for root, dirs, files in os.walk(folder):
-                for filename in files:
-                    if filename.lower().endswith(".xml"):
-                        self.xml_files.append(os.path.join(root, filename))
-            
-            self.progress_bar.set(0.5)
-            
-            if self.xml_files:
-                # Quick analysis to get available parameters
+            # Iterative scandir traversal instead of os.walk: DirEntry
+            # caches the file type from the directory read, so no extra
+            # stat call per entry and no per-directory list building.
+            # Filename and relative path come straight from the entry
+            # (name attribute + prefix slice), so the report loop never
+            # re-parses paths with os.path.basename/relpath.
+            prefix_len = len(folder.rstrip(os.sep)) + 1
+            pending_dirs = [folder]
+            while pending_dirs:
                 try:
-                    reader = XmlDataReader(folder)
-                    sample_data = reader.extract_id_and_parameters()
-                    if sample_data:
-                        # Extract unique parameters from sample data
-                        params = set()
-                        for file_data in sample_data[:3]:  # Sample first few files
-                            for param in file_data.get('parameters', []):
-                                params.add(param['Name'])
-                        self.available_parameters = sorted(list(params))
-                    else:
-                        self.available_parameters = []
-                except:
-                    self.available_parameters = []
-                
-                # Display files
-                self.file_list_text.insert("0.0", f"📁 Scanning Results\n{'='*50}\n")
-                self.file_list_text.insert("end", f"Found {len(self.xml_files)} XML files:\n\n")
-                
-                for i, file_path in enumerate(self.xml_files, 1):
-                    filename = os.path.basename(file_path)
-                    rel_path = os.path.relpath(file_path, folder)
-                    self.file_list_text.insert("end", f"{i:3d}. {filename}\n")
-                    if rel_path != filename:  # Show subfolder if different
-                        self.file_list_text.insert("end", f"     📂 {os.path.dirname(rel_path)}\n")
-                
-                if self.available_parameters:
-                    self.file_list_text.insert("end", f"\n📊 Available Parameters ({len(self.available_parameters)}):\n")
-                    for param in self.available_parameters[:10]:  # Show first 10
-                        self.file_list_text.insert("end", f"• {param}\n")
-                    if len(self.available_parameters) > 10:
-                        self.file_list_text.insert("end", f"• ... and {len(self.available_parameters) - 10} more\n")
-                
-                self.file_count_label.configure(
-                    text=f"✅ {len(self.xml_files)} XML files ready for processing"
-                )
-                self.status_var.set(f"✅ Found {len(self.xml_files)} XML files ready for processing")
+                    with os.scandir(pending_dirs.pop()) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending_dirs.append(entry.path)
+                            elif entry.name[-4:].lower() == ".xml" and entry.is_file():
+                                path = entry.path
+                                scan_entries.append((path, entry.name, path[prefix_len:]))
+                except OSError:
+                    # Skip unreadable directories, matching os.walk behavior
+                    continue
+            scan_entries.sort()
+
+            # Structure-of-arrays split: the path list doubles as
+            # self.xml_files without another per-item copy, and the
+            # report loop streams through the name/relpath lists
+            if scan_entries:
+                scan_paths, scan_names, scan_rels = map(list, zip(*scan_entries))
             else:
-                self.file_list_text.insert("0.0", "❌ No XML Files Found\n")
-                self.file_list_text.insert("end", "="*30 + "\n\n")
-                self.file_list_text.insert("end", "No XML files found in the selected folder.\n\n")
-                self.file_list_text.insert("end", "Please check:\n")
-                self.file_list_text.insert("end", "• Folder contains .xml files\n")
-                self.file_list_text.insert("end", "• Files have correct extension\n")
-                self.file_list_text.insert("end", "• You have read permissions\n")
-                
-                self.file_count_label.configure(text="❌ No XML files found")
-                self.status_var.set("❌ No XML files found in selected folder")
-                
+                scan_paths, scan_names, scan_rels = [], [], []
+            xml_files = scan_paths
+
+            if xml_files:
+                # Rescanning the same unchanged folder is common; reuse
+                # the sampled parameter list when the folder fingerprint
+                # (path, file count, newest sampled mtime) matches
+                try:
+                    cache_key = (
+                        folder,
+                        len(xml_files),
+                        max(os.path.getmtime(f) for f in xml_files[:10])
+                    )
+                except OSError:
+                    cache_key = None
+
+                cached_parameters = self._param_cache.get(cache_key) if cache_key else None
+                if cached_parameters is not None:
+                    available_parameters = cached_parameters
+                else:
+                    # Quick analysis to get available parameters: only the
+                    # first few files are parsed (concurrently) rather than
+                    # extracting the whole folder just for the catalogue
+                    try:
+                        reader = self._get_reader(folder)
+                        available_parameters = reader.extract_parameter_names(xml_files, limit=3)
+                    except:
+                        available_parameters = []
+
+                    if cache_key and available_parameters:
+                        # Bound the cache so long sessions stay small
+                        if len(self._param_cache) >= 8:
+                            self._param_cache.pop(next(iter(self._param_cache)))
+                        self._param_cache[cache_key] = available_parameters
+
+            # The report string is also assembled here so the UI thread
+            # only pays for one textbox insert
+            report = self._build_scan_report(scan_names, scan_rels, available_parameters)
+
         except Exception as e:
-            self.file_list_text.insert("0.0", f"❌ Error scanning folder:\n{str(e)}")
+            error = str(e)
+            report = f"❌ Error scanning folder:\n{error}"
+
+        self.window.after(0, lambda: self._apply_scan_results(xml_files, available_parameters, report, error))
+
+    def _set_progress(self, value):
+        """Set the progress bar, dropping updates within ~16 ms of the
+        last one so redraws are capped near 60 FPS; terminal values
+        (1.0 and resets to 0) always go through"""
+        now = time.monotonic()
+        if now - self._last_progress_t < 0.016 and 0 < value < 1.0:
+            return
+        self._last_progress_t = now
+        self.progress_bar.set(value)
+
+    def _get_reader(self, folder):
+        """Return the per-folder XmlDataReader, rebuilding it only when
+        the folder changes"""
+        if self._reader is None or self._reader_folder != folder:
+            from xml_data_reader import XmlDataReader
+            self._reader = XmlDataReader(folder)
+            self._reader_folder = folder
+        return self._reader
+
+    def _build_scan_report(self, scan_names, scan_rels, available_parameters):
+        """Assemble the scan report as one string for a single insert"""
+        if not scan_names:
+            return (
+                "❌ No XML Files Found\n"
+                + "=" * 30 + "\n\n"
+                "No XML files found in the selected folder.\n\n"
+                "Please check:\n"
+                "• Folder contains .xml files\n"
+                "• Files have correct extension\n"
+                "• You have read permissions\n"
+            )
+
+        # One join over a generator: the body text materializes in a
+        # single allocation instead of list appends per line
+        file_lines = "".join(
+            f"{i:3d}. {filename}\n"
+            + (f"     📂 {os.path.dirname(rel_path)}\n" if rel_path != filename else "")
+            for i, (filename, rel_path) in enumerate(zip(scan_names, scan_rels), 1)
+        )
+
+        param_lines = ""
+        if available_parameters:
+            param_lines = (
+                f"\n📊 Available Parameters ({len(available_parameters)}):\n"
+                + "".join(f"• {param}\n" for param in available_parameters[:10])  # Show first 10
+            )
+            if len(available_parameters) > 10:
+                param_lines += f"• ... and {len(available_parameters) - 10} more\n"
+
+        return (
+            f"📁 Scanning Results\n{'='*50}\n"
+            f"Found {len(scan_names)} XML files:\n\n"
+            f"{file_lines}{param_lines}"
+        )
+
+    def _apply_scan_results(self, xml_files, available_parameters, report, error):
+        """Apply scan results to the UI; runs on the Tk thread via after()"""
+        self.xml_files = xml_files
+        self.available_parameters = available_parameters
+        self._set_progress(0.5)
+
+        self._set_file_list_text(report)
+
+        if error is not None:
             self.status_var.set("❌ Error scanning folder")
-        
-        self.progress_bar.set(1.0)
-        self.window.after(1000, lambda: self.progress_bar.set(0))
+        elif xml_files:
+            self.file_count_label.configure(
+                text=f"✅ {len(xml_files)} XML files ready for processing"
+            )
+            self.status_var.set(f"✅ Found {len(xml_files)} XML files ready for processing")
+        else:
+            self.file_count_label.configure(text="❌ No XML files found")
+            self.status_var.set("❌ No XML files found in selected folder")
+
+        self.scan_button.configure(state="normal")
+        self._set_progress(1.0)
+        self.window.after(1000, lambda: self._set_progress(0))
         self.update_ui_state()
     
     def process_files(self):
         if self.processing:
             return
         
-        # Validate inputs
-        if not self.input_folder.get() or not os.path.exists(self.input_folder.get()):
+        # Validate inputs; Tk variables are read once into locals
+        input_folder = self.input_folder.get()
+        output_file = self.output_file.get()
+
+        if not input_folder or not os.path.exists(input_folder):
             messagebox.showerror("Error", "Please select a valid input folder.")
             return
-        
-        if not self.output_file.get():
+
+        if not output_file:
             messagebox.showerror("Error", "Please specify an output file.")
             return
-        
+
         if not self.xml_files:
             messagebox.showerror("Error", "Please scan the folder first to find XML files.")
             return
-        
+
         # Confirm processing
         result = messagebox.askyesno(
             "Confirm Processing",
             f"Ready to process {len(self.xml_files)} XML files.\n\n"
             f"Export type: {self.export_type.get().title()}\n"
-            f"Output file: {os.path.basename(self.output_file.get())}\n\n"
+            f"Output file: {os.path.basename(output_file)}\n\n"
             "Continue with processing?"
         )
         
@@ -540,9 +727,7 @@ class AdvancedCosmedGUI:
         self.process_button.configure(text="⏳ Processing...", state="disabled")
         self.scan_button.configure(state="disabled")
         
-        thread = threading.Thread(target=self._process_files_thread)
-        thread.daemon = True
-        thread.start()
+        asyncio.run_coroutine_threadsafe(self._process_files_async(), self._loop)
     
     def show_custom_params_dialog(self):
         """Show dialog for selecting custom parameters and phases"""
@@ -568,7 +753,7 @@ class AdvancedCosmedGUI:
         title_label = ctk.CTkLabel(
             main_frame,
             text="Select Parameters and Phases to Export",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self._fonts["dialog_title"]
         )
         title_label.pack(pady=(0, 20))
         
@@ -576,7 +761,7 @@ class AdvancedCosmedGUI:
         instructions = ctk.CTkLabel(
             main_frame,
             text="Choose which parameters to export and select the measurement phases for each parameter.",
-            font=ctk.CTkFont(size=12),
+            font=self._fonts["small"],
             wraplength=700
         )
         instructions.pack(pady=(0, 15))
@@ -588,52 +773,63 @@ class AdvancedCosmedGUI:
         # Store checkboxes and phase selections
         param_vars = {}
         phase_vars = {}
-        
+
+        # Shared font resource for all parameter rows
+        param_font = self._fonts["button"]
+
+        # Selection state lives in plain variables created up front,
+        # decoupled from widget existence: the quick-select buttons and
+        # save handler work on these dicts even before every row widget
+        # has been built
         for param_name in self.available_parameters:
-            # Parameter frame
-            param_frame = ctk.CTkFrame(scroll_frame)
-            param_frame.pack(fill="x", padx=5, pady=5)
-            
-            # Parameter checkbox
-            param_vars[param_name] = ctk.BooleanVar()
-            if param_name in self.custom_parameters:
-                param_vars[param_name].set(True)
-            
-            param_checkbox = ctk.CTkCheckBox(
-                param_frame,
-                text=param_name,
-                variable=param_vars[param_name],
-                font=ctk.CTkFont(size=14, weight="bold")
-            )
-            param_checkbox.pack(anchor="w", padx=10, pady=(10, 5))
-            
-            # Phases frame
-            phases_frame = ctk.CTkFrame(param_frame)
-            phases_frame.pack(fill="x", padx=20, pady=(0, 10))
-            
-            phases_label = ctk.CTkLabel(phases_frame, text="Phases to export:")
-            phases_label.pack(anchor="w", padx=10, pady=(10, 5))
-            
-            # Phase checkboxes in a grid
+            param_vars[param_name] = ctk.BooleanVar(value=param_name in self.custom_parameters)
             phase_vars[param_name] = {}
-            phases_container = ctk.CTkFrame(phases_frame)
-            phases_container.pack(fill="x", padx=10, pady=(0, 10))
-            
-            for i, phase in enumerate(self.available_phases):
-                phase_vars[param_name][phase] = ctk.BooleanVar()
+            for phase in self.available_phases:
+                phase_var = ctk.BooleanVar()
                 if param_name in self.custom_parameters and phase in self.custom_parameters[param_name]:
-                    phase_vars[param_name][phase].set(True)
+                    phase_var.set(True)
                 elif param_name not in self.custom_parameters and phase == "Max":
                     # Default to Max phase for new parameters
-                    phase_vars[param_name][phase].set(True)
-                
-                phase_cb = ctk.CTkCheckBox(
-                    phases_container,
-                    text=phase,
-                    variable=phase_vars[param_name][phase],
-                    width=80
+                    phase_var.set(True)
+                phase_vars[param_name][phase] = phase_var
+
+        # All rows live directly in the scroll frame on one grid: a
+        # parameter row followed by its phase row. Rows are created in
+        # small batches on the event loop so the dialog opens instantly
+        # even for large parameter catalogues.
+        phase_count = len(self.available_phases)
+
+        def build_rows(start, batch_size=10):
+            if not custom_window.winfo_exists():
+                return
+
+            end = min(start + batch_size, len(self.available_parameters))
+            for index in range(start, end):
+                param_name = self.available_parameters[index]
+
+                param_checkbox = ctk.CTkCheckBox(
+                    scroll_frame,
+                    text=param_name,
+                    variable=param_vars[param_name],
+                    font=param_font
                 )
-                phase_cb.grid(row=i//4, column=i%4, padx=5, pady=2, sticky="w")
+                param_checkbox.grid(row=2 * index, column=0, columnspan=phase_count,
+                                    padx=10, pady=(10, 2), sticky="w")
+
+                for phase_idx, phase in enumerate(self.available_phases):
+                    phase_cb = ctk.CTkCheckBox(
+                        scroll_frame,
+                        text=phase,
+                        variable=phase_vars[param_name][phase],
+                        width=80
+                    )
+                    phase_cb.grid(row=2 * index + 1, column=phase_idx,
+                                  padx=((20, 2) if phase_idx == 0 else 2), pady=(0, 6), sticky="w")
+
+            if end < len(self.available_parameters):
+                custom_window.after(10, lambda: build_rows(end))
+
+        build_rows(0, batch_size=20)
         
         # Buttons frame
         buttons_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
@@ -643,33 +839,47 @@ class AdvancedCosmedGUI:
         quick_frame = ctk.CTkFrame(buttons_frame, fg_color="transparent")
         quick_frame.pack(side="left")
         
+        # Quick selections are described as per-parameter phase bitmasks
+        # and diffed against the current state: a Tk variable is only
+        # written when its value actually changes, since every write is a
+        # Tcl round-trip plus a checkbox redraw (hundreds per click with
+        # the naive loop)
+        phase_bit = {phase: 1 << i for i, phase in enumerate(self.available_phases)}
+        max_bit = phase_bit["Max"]
+
+        def apply_selection(selected_for, mask_for):
+            for param in self.available_parameters:
+                selected = selected_for(param)
+                if param_vars[param].get() != selected:
+                    param_vars[param].set(selected)
+
+                target_mask = mask_for(param)
+                if target_mask is None:  # leave this row's phases as-is
+                    continue
+                for phase, bit in phase_bit.items():
+                    desired = bool(target_mask & bit)
+                    if phase_vars[param][phase].get() != desired:
+                        phase_vars[param][phase].set(desired)
+
         def select_all_max():
             """Select all parameters with Max phase only"""
-            for param in self.available_parameters:
-                param_vars[param].set(True)
-                for phase in self.available_phases:
-                    phase_vars[param][phase].set(phase == "Max")
-        
+            apply_selection(lambda param: True, lambda param: max_bit)
+
         def select_key_params():
             """Select the standard 15 key parameters"""
-            key_params = ["t", "Speed", "Pace", "VO2", "VO2/kg", "VCO2", "METS", "RQ", "VE", "Rf", "HR", "VO2/HR"]
-            for param in self.available_parameters:
-                if param in key_params:
-                    param_vars[param].set(True)
-                    for phase in self.available_phases:
-                        if param == "VO2/kg":
-                            phase_vars[param][phase].set(phase in ["MFO", "AT", "RC", "Max"])
-                        else:
-                            phase_vars[param][phase].set(phase == "Max")
-                else:
-                    param_vars[param].set(False)
-        
+            key_params = {"t", "Speed", "Pace", "VO2", "VO2/kg", "VCO2", "METS", "RQ", "VE", "Rf", "HR", "VO2/HR"}
+            vo2kg_mask = phase_bit["MFO"] | phase_bit["AT"] | phase_bit["RC"] | max_bit
+
+            def mask_for(param):
+                if param not in key_params:
+                    return None
+                return vo2kg_mask if param == "VO2/kg" else max_bit
+
+            apply_selection(lambda param: param in key_params, mask_for)
+
         def clear_all():
             """Clear all selections"""
-            for param in self.available_parameters:
-                param_vars[param].set(False)
-                for phase in self.available_phases:
-                    phase_vars[param][phase].set(False)
+            apply_selection(lambda param: False, lambda param: 0)
         
         quick_all_button = ctk.CTkButton(quick_frame, text="All (Max)", command=select_all_max, width=100)
         quick_all_button.pack(side="left", padx=(0, 5))
@@ -724,34 +934,52 @@ class AdvancedCosmedGUI:
         cancel_button = ctk.CTkButton(action_frame, text="❌ Cancel", command=cancel_selection, width=100)
         cancel_button.pack(side="right")
     
-    def _process_files_thread(self):
+    async def _process_files_async(self):
         try:
             # Initialize
-            self.window.after(0, lambda: self.status_var.set("🔧 Initializing processing..."))
-            self.window.after(0, lambda: self.progress_bar.set(0.1))
+            self._ui_queue.put(('status', "🔧 Initializing processing..."))
+            self._ui_queue.put(('progress', 0.1))
             
-            # Get export type and create output filename
+            # Get export type and create output filename; single Tk
+            # round-trip per variable and a table lookup for the suffix
             export_type = self.export_type.get()
-            output_filename = "converted_data"
-            
-            if export_type == "selected":
-                output_filename += "_selected_parameters"
-            elif export_type == "max":
-                output_filename += "_max_only"
-            elif export_type == "complete":
-                output_filename += "_complete"
-            elif export_type == "custom":
-                output_filename += "_custom_parameters"
-            
-            output_filename += ".xlsx"
-            output_path = os.path.join(os.path.dirname(self.output_file.get()), output_filename)
+            out_dir = os.path.dirname(self.output_file.get())
+            output_filename = f"converted_data{_EXPORT_SUFFIX.get(export_type, '')}.xlsx"
+            output_path = os.path.join(out_dir, output_filename)
             
             # Initialize components
-            self.window.after(0, lambda: self.status_var.set("📖 Extracting data from XML files..."))
-            self.window.after(0, lambda: self.progress_bar.set(0.3))
+            self._ui_queue.put(('status', "📖 Extracting data from XML files..."))
+            self._ui_queue.put(('progress', 0.3))
             
-            reader = XmlDataReader(self.input_folder.get())
-            extracted_data = reader.extract_id_and_parameters()
+            input_folder = self.input_folder.get()
+            reader = self._get_reader(input_folder)
+            # Reuse the scan's file list so extraction skips a second
+            # directory walk
+            reader.files = list(self.xml_files) if self.xml_files else None
+
+            # Unchanged files parse to the same dataset regardless of
+            # export type, so re-exports of the same folder reuse it
+            try:
+                cache_key = (input_folder, tuple((f, os.path.getmtime(f)) for f in self.xml_files))
+            except OSError:
+                cache_key = None
+
+            extracted_data = self._parse_cache.get(cache_key) if cache_key is not None else None
+
+            if extracted_data is None:
+                # Extraction runs across a process pool inside DataExtractor;
+                # report per-batch progress across the 0.3-0.6 band as the
+                # workers complete
+                total_files = len(self.xml_files) or 1
+
+                def on_extract_progress(done):
+                    fraction = min(done / total_files, 1.0)
+                    self._ui_queue.put(('progress', 0.3 + 0.3 * fraction))
+
+                extracted_data = reader.extract_id_and_parameters(progress_callback=on_extract_progress)
+                if cache_key is not None and extracted_data:
+                    self._parse_cache.clear()
+                    self._parse_cache[cache_key] = extracted_data
             
             if not extracted_data:
                 self.window.after(0, lambda: messagebox.showerror(
@@ -762,15 +990,16 @@ class AdvancedCosmedGUI:
                 return
             
             # Create exporter and export data
-            self.window.after(0, lambda: self.status_var.set("📊 Creating Excel file..."))
-            self.window.after(0, lambda: self.progress_bar.set(0.6))
+            self._ui_queue.put(('status', "📊 Creating Excel file..."))
+            self._ui_queue.put(('progress', 0.6))
             
+            from excel_exporter import ExcelExporter
             exporter = ExcelExporter(output_path)
             
             # Handle different export types
             if export_type == "custom":
                 if not self.custom_parameters:
-                    self.window.after(0, messagebox.showerror(
+                    self.window.after(0, lambda: messagebox.showerror(
                         "Error",
                         "No custom parameters selected.\n\n"
                         "Please configure custom parameters first by clicking the 'Select Parameters' button."
@@ -778,13 +1007,13 @@ class AdvancedCosmedGUI:
                     return
                 
                 # Export with custom parameters
-                self.window.after(0, self.status_var.set("💾 Exporting custom parameters to Excel..."))
-                self.window.after(0, self.progress_bar.set(0.8))
+                self._ui_queue.put(('status', "💾 Exporting custom parameters to Excel..."))
+                self._ui_queue.put(('progress', 0.8))
 
                 success = exporter.export_custom_parameters(extracted_data, self.custom_parameters)
                 
                 if not success:
-                    self.window.after(0, messagebox.showerror(
+                    self.window.after(0, lambda: messagebox.showerror(
                         "Error",
                         "Failed to export custom parameters.\n\n"
                         "Please check the error logs for details."
@@ -792,8 +1021,8 @@ class AdvancedCosmedGUI:
                     return      
             else:
                 # Standard export
-                self.window.after(0, self.status_var.set(f"💾 Exporting {export_type} data to Excel..."))
-                self.window.after(0, self.progress_bar.set(0.8))
+                self._ui_queue.put(('status', f"💾 Exporting {export_type} data to Excel..."))
+                self._ui_queue.put(('progress', 0.8))
                 
                 if export_type == "selected":
                     exporter.export_selected_parameters(extracted_data)
@@ -803,57 +1032,74 @@ class AdvancedCosmedGUI:
                     exporter.export_extracted_xml_data(extracted_data)
             
             # Complete
-            self.window.after(0, self.progress_bar.set(1.0))
-            self.window.after(0, self.status_var.set(f"✅ Successfully exported {len(extracted_data)} subjects to Excel"))
-            
-            # Success message
+            self._ui_queue.put(('progress', 1.0))
+            # Success message pieces computed once into locals; out_dir is
+            # already known from building output_path
+            n_subjects = len(extracted_data)
+            out_base = os.path.basename(output_path)
+
+            self._ui_queue.put(('status', f"✅ Successfully exported {n_subjects} subjects to Excel"))
+
             export_description = export_type.title()
             if export_type == "custom":
                 param_count = len(self.custom_parameters)
-                phase_count = sum(len(phases) for phases in self.custom_parameters.values())
+                phase_count = sum(map(len, self.custom_parameters.values()))
                 export_description = f"Custom ({param_count} parameters, {phase_count} phases)"
-            
+
             success_msg = (
                 f"🎉 Conversion Completed Successfully!\n\n"
-                f"📊 Processed: {len(extracted_data)} XML files\n"
+                f"📊 Processed: {n_subjects} XML files\n"
                 f"📁 Export type: {export_description}\n"
-                f"💾 Output file: {os.path.basename(output_path)}\n"
-                f"📍 Location: {os.path.dirname(output_path)}"
+                f"💾 Output file: {out_base}\n"
+                f"📍 Location: {out_dir}"
             )
             
-            self.window.after(0, messagebox.showinfo("Success", success_msg))
+            self.window.after(0, lambda: messagebox.showinfo("Success", success_msg))
             
             # Auto-open file if enabled
             if self.auto_open_var.get():
-                try:
-                    os.startfile(output_path)
-                except:
-                    pass  # Ignore if can't open
+                self._open_externally(output_path)
             
         except Exception as e:
             error_msg = f"❌ Processing Error\n\nAn error occurred during processing:\n\n{str(e)}"
-            self.window.after(0, messagebox.showerror("Error", error_msg))
-            self.window.after(0, self.status_var.set("❌ Processing failed"))
+            self.window.after(0, lambda: messagebox.showerror("Error", error_msg))
+            self._ui_queue.put(('status', "❌ Processing failed"))
             
         finally:
-            # Reset UI
+            # Reset UI through the same drained queue as the status updates
             self.processing = False
-            self.window.after(0, lambda: self.process_button.configure(text="⚡ Convert to Excel", state="normal"))
-            self.window.after(0, lambda: self.scan_button.configure(state="normal"))
-            self.window.after(0, self.update_ui_state)
+            self._ui_queue.put(('call', lambda: self.process_button.configure(text="⚡ Convert to Excel", state="normal")))
+            self._ui_queue.put(('call', lambda: self.scan_button.configure(state="normal")))
+            self._ui_queue.put(('call', self.update_ui_state))
     
     def clear_all(self):
         self.input_folder.set("")
         self.output_file.set("")
-        self.file_list_text.delete("0.0", "end")
+        self._set_file_list_text("")
         self.xml_files = []
+        self._parse_cache.clear()
         self.progress_bar.set(0)
         self.status_var.set("Ready to process XML files")
         self.file_count_label.configure(text="No files scanned yet")
         self.update_ui_state()
     
     def update_ui_state(self):
-        has_input = bool(self.input_folder.get() and os.path.exists(self.input_folder.get()))
+        """Coalesce bursts of state refreshes into one deferred apply"""
+        if self._ui_state_after_id is not None:
+            return
+        self._ui_state_after_id = self.window.after(50, self._apply_ui_state)
+
+    def _apply_ui_state(self):
+        self._ui_state_after_id = None
+        # The folder-exists stat can take tens of milliseconds on network
+        # shares and this runs on every variable change; cache the result
+        # per folder string
+        folder = self.input_folder.get()
+        if folder == self._exists_cache[0]:
+            has_input = self._exists_cache[1]
+        else:
+            has_input = bool(folder and os.path.isdir(folder))
+            self._exists_cache = (folder, has_input)
         has_output = bool(self.output_file.get())
         has_files = bool(self.xml_files)
         
@@ -866,12 +1112,21 @@ class AdvancedCosmedGUI:
         ctk.set_appearance_mode(new_mode)
     
     def show_help(self):
+        # Build the window once and hide it on close; later clicks just
+        # bring the cached Toplevel back instead of re-creating widgets
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self._help_window.deiconify()
+            self._help_window.lift()
+            return
+
         help_window = ctk.CTkToplevel(self.window)
+        self._help_window = help_window
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
         help_window.title("Help - COSMED Converter")
         help_window.geometry("700x500")
         help_window.transient(self.window)
         
-        help_text = ctk.CTkTextbox(help_window, font=ctk.CTkFont(size=12))
+        help_text = ctk.CTkTextbox(help_window, font=self._fonts["small"])
         help_text.pack(fill="both", expand=True, padx=20, pady=20)
         
         help_content = """
@@ -952,10 +1207,45 @@ For more information, visit the GitHub repository or contact support.
         )
     
     def open_github(self):
+        import webbrowser
         url: str = "https://github.com/Ganzosupremo/OmniaCosmedDataCoverter"
         webbrowser.open(url)
 
+    def _open_externally(self, path):
+        """Launch the platform default application for a file without
+        blocking the calling thread; os.startfile waits on the shell"""
+        try:
+            if sys.platform == 'win32':
+                subprocess.Popen(
+                    ['cmd', '/c', 'start', '', path],
+                    creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+                    close_fds=True
+                )
+            elif sys.platform == 'darwin':
+                subprocess.Popen(['open', path], start_new_session=True)
+            else:
+                subprocess.Popen(['xdg-open', path], start_new_session=True)
+        except Exception:
+            pass  # auto-open is best-effort
+
+    def _drain_ui_queue(self):
+        """Apply all pending worker UI messages, then reschedule"""
+        while True:
+            try:
+                kind, value = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'status':
+                self.status_var.set(value)
+            elif kind == 'progress':
+                self._set_progress(value)
+            elif kind == 'call':
+                # arbitrary zero-argument UI work from a worker thread
+                value()
+        self.window.after(50, self._drain_ui_queue)
+
     def run(self):
+        self._drain_ui_queue()
         self.window.mainloop()
 
 def main():
@@ -1,7 +1,7 @@
 """
 Refactored Excel Exporter using modular architecture
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from modules import ExportManager, ExcelFormatter, ErrorHandler, PathValidator
 
 class ExcelExporter:
@@ -9,34 +9,39 @@ class ExcelExporter:
     Excel Exporter class for exporting data to Excel files.
     """
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path):
         """
         Initialize Excel Exporter
-        
+
         Args:
-            file_path: Output Excel file path
+            file_path: Output Excel file path, or a writable binary
+                       file-like object (e.g. io.BytesIO) to build the
+                       workbook in memory without a disk round-trip
         """
         self.file_path = file_path
-        
+
         # Initialize modules
         self.export_manager = ExportManager()
         self.excel_formatter = ExcelFormatter()
         self.error_handler = ErrorHandler()
         self.path_validator = PathValidator()
-        
-        # Validate output file path
-        try:
-            self.file_path = self.path_validator.validate_file_path(file_path)
-        except ValueError as e:
-            self.error_handler.handle_exception(e, "ExcelExporter.__init__", "path_validation")
-            raise
 
-    def export_selected_parameters(self, extracted_data: List[Dict[str, Any]]) -> None:
+        # Validate output file path; file-like targets skip path checks
+        if isinstance(file_path, str):
+            try:
+                self.file_path = self.path_validator.validate_file_path(file_path)
+            except ValueError as e:
+                self.error_handler.handle_exception(e, "ExcelExporter.__init__", "path_validation")
+                raise
+
+    def export_selected_parameters(self, extracted_data: List[Dict[str, Any]], segment_size: Optional[int] = None) -> None:
         """
         Export selected parameters to Excel (15 key parameters)
         
         Args:
             extracted_data: List of extracted XML data from xml_data_reader
+            segment_size: Optional maximum subjects per output file; large
+                exports are split into numbered ``_part{k}`` workbooks
         """
         try:
             self.error_handler.log_info(f"Starting selected parameters export to {self.file_path}", "export_selected_parameters")
@@ -48,7 +53,7 @@ class ExcelExporter:
             df = self.excel_formatter.create_formatted_dataframe(extracted_data, "selected")
             
             # Save with formatting using the Excel formatter
-            self.excel_formatter.save_formatted_excel(extracted_data, self.file_path, "selected")
+            self.excel_formatter.save_formatted_excel(extracted_data, self.file_path, "selected", segment_size=segment_size)
             
             self.error_handler.log_info(f"Successfully exported {len(extracted_data)} records with selected parameters", "export_selected_parameters")
             
@@ -56,12 +61,14 @@ class ExcelExporter:
             self.error_handler.handle_exception(e, "export_selected_parameters", "export_error")
             raise
 
-    def export_max_values_only(self, extracted_data: List[Dict[str, Any]]) -> None:
+    def export_max_values_only(self, extracted_data: List[Dict[str, Any]], segment_size: Optional[int] = None) -> None:
         """
         Export only maximum values to Excel
         
         Args:
             extracted_data: List of extracted XML data from xml_data_reader
+            segment_size: Optional maximum subjects per output file; large
+                exports are split into numbered ``_part{k}`` workbooks
         """
         try:
             self.error_handler.log_info(f"Starting max values export to {self.file_path}", "export_max_values_only")
@@ -73,7 +80,7 @@ class ExcelExporter:
             df = self.excel_formatter.create_formatted_dataframe(extracted_data, "max")
             
             # Save with formatting using the Excel formatter
-            self.excel_formatter.save_formatted_excel(extracted_data, self.file_path, "max")
+            self.excel_formatter.save_formatted_excel(extracted_data, self.file_path, "max", segment_size=segment_size)
             
             self.error_handler.log_info(f"Successfully exported {len(extracted_data)} records with max values", "export_max_values_only")
             
@@ -81,12 +88,14 @@ class ExcelExporter:
             self.error_handler.handle_exception(e, "export_max_values_only", "export_error")
             raise
 
-    def export_extracted_xml_data(self, extracted_data: List[Dict[str, Any]]) -> None:
+    def export_extracted_xml_data(self, extracted_data: List[Dict[str, Any]], segment_size: Optional[int] = None) -> None:
         """
         Export complete extracted XML data to Excel
         
         Args:
             extracted_data: List of extracted XML data from xml_data_reader
+            segment_size: Optional maximum subjects per output file; large
+                exports are split into numbered ``_part{k}`` workbooks
         """
         try:
             self.error_handler.log_info(f"Starting complete dataset export to {self.file_path}", "export_extracted_xml_data")
@@ -98,7 +107,7 @@ class ExcelExporter:
             df = self.excel_formatter.create_formatted_dataframe(extracted_data, "complete")
             
             # Save with formatting using the Excel formatter
-            self.excel_formatter.save_formatted_excel(extracted_data, self.file_path, "complete")
+            self.excel_formatter.save_formatted_excel(extracted_data, self.file_path, "complete", segment_size=segment_size)
             
             self.error_handler.log_info(f"Successfully exported {len(extracted_data)} records with complete dataset", "export_extracted_xml_data")
             
@@ -1,9 +1,11 @@
-from xml_data_reader import XmlDataReader
-from excel_exporter import ExcelExporter
 import argparse
 import os
 import sys
 
+# XmlDataReader and ExcelExporter are imported where needed: pulling in
+# the pandas/openpyxl stack costs several hundred milliseconds, which
+# --help and --list invocations should not pay
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -41,6 +43,22 @@ Examples:
         help="Export type: selected (default), max, or complete"
     )
     
+    parser.add_argument(
+        "--format", "-f",
+        choices=["xlsx", "csv"],
+        default="xlsx",
+        help="Output format: xlsx (default, formatted workbook) or csv (fastest, plain data)"
+    )
+
+    parser.add_argument(
+        "--segment-size", "-s",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Split the export into numbered _part files of at most N subjects each "
+             "(keeps very large workbooks openable in Excel)"
+    )
+
     parser.add_argument(
         "--list", "-l",
         action="store_true",
@@ -67,14 +85,14 @@ Examples:
     # Set default output filename if not provided
     if not args.output_file:
         export_type_names = {
-            "selected": "selected_parameters.xlsx",
-            "max": "max_values.xlsx",
-            "complete": "complete_data.xlsx"
+            "selected": "selected_parameters",
+            "max": "max_values",
+            "complete": "complete_data"
         }
-        args.output_file = export_type_names[args.export]
-    
-    # Initialize XML reader
-    xml_reader = XmlDataReader(args.input_path)
+        args.output_file = f"{export_type_names[args.export]}.{args.format}"
+    elif args.format == "csv" and not args.output_file.lower().endswith(".csv"):
+        # Explicit --format csv wins over the output file extension
+        args.output_file = os.path.splitext(args.output_file)[0] + ".csv"
     
     try:
         # List files if requested
@@ -97,7 +115,10 @@ Examples:
         # Extract data
         if args.verbose:
             print(f"Extracting data from XML files in: {args.input_path}")
-        
+
+        from xml_data_reader import XmlDataReader
+
+        xml_reader = XmlDataReader(args.input_path)
         extracted_data = xml_reader.extract_id_and_parameters()
         
         if not extracted_data:
@@ -110,26 +131,28 @@ Examples:
                 print(f"  - {data['filename']} (Subject: {data['subject_id']})")
         
         # Export data based on selected option
+        from excel_exporter import ExcelExporter
+
         exporter = ExcelExporter(args.output_file)
         
         if args.export == "selected":
             if args.verbose:
                 print(f"Exporting selected parameters to: {args.output_file}")
-            exporter.export_selected_parameters(extracted_data)
+            exporter.export_selected_parameters(extracted_data, segment_size=args.segment_size)
             print(f"✓ Selected parameters exported to: {args.output_file}")
             print("  Contains: 15 key parameters including VO2/kg at MFO, AT, RC, and Max")
             
         elif args.export == "max":
             if args.verbose:
                 print(f"Exporting max values to: {args.output_file}")
-            exporter.export_max_values_only(extracted_data)
+            exporter.export_max_values_only(extracted_data, segment_size=args.segment_size)
             print(f"✓ Max values exported to: {args.output_file}")
             print("  Contains: Maximum values for all parameters")
             
         elif args.export == "complete":
             if args.verbose:
                 print(f"Exporting complete data to: {args.output_file}")
-            exporter.export_extracted_xml_data(extracted_data)
+            exporter.export_extracted_xml_data(extracted_data, segment_size=args.segment_size)
             print(f"✓ Complete data exported to: {args.output_file}")
             print("  Contains: All measurement phases for all parameters")
         
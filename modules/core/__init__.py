@@ -5,5 +5,6 @@ __author__ = "COSMED Data Converter Team"
 from .xml_parser import XmlParser
 from .excel_formatter import ExcelFormatter
 from .export_manager import ExportManager
+from .fast_xlsx_writer import FastXlsxWriter
 
-__all__ = ["XmlParser", "ExcelFormatter", "ExportManager"]
\ No newline at end of file
+__all__ = ["XmlParser", "ExcelFormatter", "ExportManager", "FastXlsxWriter"]
\ No newline at end of file
@@ -2,12 +2,33 @@
 Data Extractor Module
 Handles extraction of COSMED data from XML files
 """
+import io
 import os
+import shelve
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from .xml_parser import XmlParser
 from ..utils.file_scanner import FileScanner
 from ..utils.path_validator import PathValidator
 
+# Minimum number of files before process-pool dispatch pays for itself
+PARALLEL_EXTRACTION_THRESHOLD = 8
+
+# On-disk parse cache; entries are keyed by (path, mtime_ns, size) so any
+# file change misses automatically
+DISK_CACHE_PATH = os.path.expanduser('~/.cosmed_parse_cache')
+
+# Per-process extractor reused across worker invocations
+_worker_extractor = None
+
+def _extract_file_worker(file_path: str) -> Optional[Dict[str, Any]]:
+    """Extract a single file inside a worker process (module-level so it can be pickled)"""
+    global _worker_extractor
+    if _worker_extractor is None:
+        _worker_extractor = DataExtractor()
+    return _worker_extractor.extract_from_file(file_path)
+
 class DataExtractor:
     """Extracts COSMED data from XML files"""
     
@@ -16,28 +37,172 @@ class DataExtractor:
         self.file_scanner = FileScanner()
         self.path_validator = PathValidator()
     
-    def extract_from_directory(self, directory: str) -> List[Dict[str, Any]]:
+    def extract_from_directory(self, directory: str, files: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Extract data from all XML files in directory
-        
+
         Args:
             directory: Directory containing XML files
-            
+            files: Pre-scanned XML file paths; skips the directory scan
+
         Returns:
             List of extracted data dictionaries
         """
-        validated_dir = self.path_validator.validate_directory(directory)
-        xml_files = self.file_scanner.find_xml_files(validated_dir)
-        
         extracted_data = []
-        
-        for file_path in xml_files:
-            file_data = self.extract_from_file(file_path)
-            if file_data is not None:
-                extracted_data.append(file_data)
-        
+        for batch in self.iter_extraction_batches(directory, files=files):
+            extracted_data.extend(batch)
         return extracted_data
+
+    def iter_extraction_batches(self, directory: str, batch_size: int = 500, files: Optional[List[str]] = None) -> Any:
+        """
+        Yield extracted file data in batches as parsing completes
+
+        Generator form of extract_from_directory: batches become available
+        while later files are still being parsed, so callers can overlap
+        their own work (e.g. preparing the export layout) with extraction.
+
+        Args:
+            directory: Directory containing XML files
+            batch_size: Number of files per yielded batch
+            files: Pre-scanned XML file paths; when given, the directory
+                   scan is skipped and these are parsed as-is
+
+        Yields:
+            Lists of extracted data dictionaries
+        """
+        if files is not None:
+            xml_files = list(files)
+        else:
+            validated_dir = self.path_validator.validate_directory(directory)
+            xml_files = self.file_scanner.find_xml_files(validated_dir)
+
+        # Unchanged files are served from the on-disk cache; only misses
+        # are parsed, so repeat runs over a stable folder skip extraction
+        cache = self._open_disk_cache()
+        cache_keys: Dict[str, Optional[str]] = {}
+        cached_results: Dict[str, Dict[str, Any]] = {}
+        miss_files: List[str] = []
+
+        try:
+            for file_path in xml_files:
+                key = self._disk_cache_key(file_path) if cache is not None else None
+                cache_keys[file_path] = key
+                if key is not None:
+                    try:
+                        cached_results[file_path] = cache[key]
+                        continue
+                    except Exception:
+                        pass  # missing or unreadable entry: reparse
+                miss_files.append(file_path)
+
+            # Parsed misses come back in submission order, so cached and
+            # fresh records can be interleaved in the original file order
+            parsed = self._iter_parsed(miss_files)
+            batch = []
+            for file_path in xml_files:
+                if file_path in cached_results:
+                    file_data = cached_results[file_path]
+                else:
+                    file_data = next(parsed)
+                    key = cache_keys[file_path]
+                    if cache is not None and key is not None and file_data is not None:
+                        try:
+                            cache[key] = file_data
+                        except Exception:
+                            pass
+                if file_data is not None:
+                    batch.append(file_data)
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+
+            if batch:
+                yield batch
+        finally:
+            if cache is not None:
+                try:
+                    cache.close()
+                except Exception:
+                    pass
+
+    def _iter_parsed(self, xml_files: List[str]) -> Any:
+        """
+        Yield one extraction result (or None) per file, in input order
+
+        Per-file parsing is CPU-bound and independent, so large batches
+        are dispatched across a worker pool; small batches stay
+        sequential to avoid worker start-up overhead. The map iterator
+        is consumed lazily, so results flow out while workers parse.
+
+        Args:
+            xml_files: XML file paths to parse
+
+        Yields:
+            Extraction dictionaries, or None per failed file
+        """
+        cpu_count = os.cpu_count() or 1
+        if len(xml_files) >= PARALLEL_EXTRACTION_THRESHOLD and cpu_count > 1:
+            executor_class = self._select_executor_class(xml_files[0])
+            if executor_class is ProcessPoolExecutor:
+                max_workers = cpu_count
+            else:
+                max_workers = min(32, len(xml_files))
+            with executor_class(max_workers=max_workers) as executor:
+                yield from executor.map(_extract_file_worker, xml_files, chunksize=16)
+        else:
+            for file_path in xml_files:
+                yield self.extract_from_file(file_path)
+
+    @staticmethod
+    def _open_disk_cache():
+        """Open the shared parse cache; None when unavailable"""
+        try:
+            return shelve.open(DISK_CACHE_PATH)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _disk_cache_key(file_path: str) -> Optional[str]:
+        """Cache key that changes with any file modification"""
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return None
+        return f"{file_path}|{stat_result.st_mtime_ns}|{stat_result.st_size}"
     
+    def _select_executor_class(self, sample_file: str):
+        """
+        Pick the pool type from where one sample file spends its time
+
+        Parsing is CPU-bound and suits worker processes, but on slow
+        storage (network shares) the workload is read-bound and a thread
+        pool avoids process start-up and result pickling. The first file
+        is read cold, then parsed from the warm page cache; if parsing
+        still dominates, the batch is treated as CPU-bound.
+
+        Args:
+            sample_file: File to time; it is parsed once as the sample
+
+        Returns:
+            ProcessPoolExecutor or ThreadPoolExecutor
+        """
+        try:
+            start = time.perf_counter()
+            with open(sample_file, 'rb') as file_obj:
+                file_obj.read()
+            read_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            self.xml_parser.stream_extract(sample_file)
+            parse_time = time.perf_counter() - start
+        except OSError:
+            return ProcessPoolExecutor
+
+        total = read_time + parse_time
+        if total <= 0 or parse_time / total > 0.5:
+            return ProcessPoolExecutor
+        return ThreadPoolExecutor
+
     def extract_from_file(self, file_path: str) -> Optional[Dict[str, Any]]:
         """
         Extract data from single XML file
@@ -49,23 +214,19 @@ class DataExtractor:
             Extracted data dictionary or None if extraction fails
         """
         validated_path = self.path_validator.validate_file_path(file_path, must_exist=True)
-        
-        # Parse XML
-        root = self.xml_parser.parse_file(validated_path)
-        if root is None:
+
+        # Parse subject ID and parameters in a single streaming pass,
+        # validating COSMED structure along the way
+        streamed = self.xml_parser.stream_extract(validated_path)
+        if streamed is None:
             return None
-        
-        # Validate COSMED structure
-        if not self.xml_parser.validate_cosmed_structure(root):
+
+        subject_id, parameters, has_cosmed_structure = streamed
+        if not has_cosmed_structure:
             return None
-        
-        # Extract basic info
+
         filename = os.path.basename(validated_path)
-        subject_id = self.xml_parser.extract_subject_id(root)
-        
-        # Extract parameters
-        parameters = self._extract_parameters(root)
-        
+
         return {
             'file_path': validated_path,
             'filename': filename,
@@ -75,6 +236,48 @@ class DataExtractor:
             'extraction_success': True
         }
     
+    def extract_from_sources(self, sources) -> List[Dict[str, Any]]:
+        """
+        Extract data from in-memory XML sources
+
+        Counterpart to extract_from_directory for callers that already
+        hold the document bytes (network payloads, archive members):
+        each source is parsed straight from memory, with no staging copy
+        on disk and no directory scan.
+
+        Args:
+            sources: Iterable of (name, source) pairs where source is
+                raw bytes or a readable binary file-like object
+
+        Returns:
+            List of extracted data dictionaries in the same shape as
+            extract_from_directory
+        """
+        extracted_data = []
+
+        for name, source in sources:
+            if isinstance(source, (bytes, bytearray)):
+                source = io.BytesIO(source)
+
+            streamed = self.xml_parser.stream_extract(source)
+            if streamed is None:
+                continue
+
+            subject_id, parameters, has_cosmed_structure = streamed
+            if not has_cosmed_structure:
+                continue
+
+            extracted_data.append({
+                'file_path': name,
+                'filename': os.path.basename(name) if name else name,
+                'subject_id': subject_id,
+                'parameters': parameters,
+                'parameter_count': len(parameters),
+                'extraction_success': True
+            })
+
+        return extracted_data
+
     def _extract_parameters(self, root) -> List[Dict[str, Any]]:
         """
         Extract all parameters from XML root
@@ -89,7 +292,9 @@ class DataExtractor:
         
         parameters_section = self.xml_parser.extract_parameters_section(root)
         if parameters_section is not None:
-            for param_element in parameters_section.findall("Parameter"):
+            # iter() yields matching elements lazily instead of building
+            # the intermediate list findall() would allocate
+            for param_element in parameters_section.iter("Parameter"):
                 param_data = self.xml_parser.parse_parameter_element(param_element)
                 parameters.append(param_data)
         
@@ -2,11 +2,60 @@
 Excel Formatter Module
 Handles Excel file formatting and styling
 """
+import os
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Any, Optional
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils.dataframe import dataframe_to_rows
+from .fast_xlsx_writer import FastXlsxWriter
+
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+try:
+    from pyexcelerate import Workbook as PyexcelerateWorkbook
+    PYEXCELERATE_AVAILABLE = True
+except ImportError:
+    PYEXCELERATE_AVAILABLE = False
+
+# All measurement phases recorded per parameter in COSMED XML exports
+MEASUREMENT_PHASES = ['Value', 'Rest', 'Warmup', 'MFO', 'AT', 'RC', 'Max', 'Pred', 'PercPred', 'Normal', 'Class']
+
+# Column suffixes whose values are expected to be numeric (Normal and
+# Class carry labels and stay as text)
+NUMERIC_COLUMN_SUFFIXES = (
+    '_Value', '_Rest', '_Warmup', '_MFO', '_AT', '_RC',
+    '_Max', '_Pred', '_PercPred', ' Max'
+)
+
+# Row count above which the openpyxl styled writer is swapped for the
+# streaming engines: openpyxl holds the whole workbook in memory, which
+# matters once cohorts reach the thousands of subjects
+STREAMING_ROW_THRESHOLD = 1000
+
+# The 15 key parameters of the selected export; frozenset for O(1)
+# membership tests in the per-parameter loop
+_SELECTED_PARAMETERS = frozenset({
+    "t", "Speed", "Pace", "VO2", "VO2/kg", "VCO2",
+    "METS", "RQ", "VE", "Rf", "HR", "VO2/HR"
+})
+
+# Phases emitted per selected parameter: VO2/kg keeps its submaximal
+# phases, every other parameter exports only its maximum. Single source
+# of truth for every code path that builds the selected layout.
+SELECTED_PHASES_BY_PARAMETER = {'VO2/kg': ['MFO', 'AT', 'RC', 'Max']}
+DEFAULT_SELECTED_PHASES = ['Max']
 
 class ExcelFormatter:
     """Excel formatting utilities for COSMED data"""
@@ -21,6 +70,11 @@ class ExcelFormatter:
             top=Side(style="thin"),
             bottom=Side(style="thin")
         )
+        # Column-name caches keyed on (name, unit); parameter layouts
+        # repeat across files and across exports, so the formatted names
+        # are built once per parameter rather than once per cell
+        self._phase_column_cache = {}     # -> tuple of 11 phase column names
+        self._selected_column_cache = {}  # -> list of (column_name, phase)
     
     def create_formatted_dataframe(self, data: List[Dict[str, Any]], data_type: str = "complete") -> pd.DataFrame:
         """
@@ -37,119 +91,168 @@ class ExcelFormatter:
             return pd.DataFrame()
         
         if data_type == "max":
-            return self._create_max_values_dataframe(data)
+            df = self._create_max_values_dataframe(data)
         elif data_type == "selected":
-            return self._create_selected_parameters_dataframe(data)
+            df = self._create_selected_parameters_dataframe(data)
         else:
-            return self._create_complete_dataframe(data)
+            df = self._create_complete_dataframe(data)
+
+        return self._coerce_numeric_columns(df)
+
+    def _coerce_numeric_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert measurement columns to numeric dtype, one pass per column
+
+        XML attributes arrive as strings; pd.to_numeric converts a whole
+        column at C speed so Excel receives real numbers instead of text
+        cells. A column is only converted when every non-empty value
+        survives the conversion, which keeps textual parameters such as
+        Pace (mm:ss/km) intact.
+
+        Args:
+            df: Assembled DataFrame (modified in place)
+
+        Returns:
+            The DataFrame with numeric measurement columns converted
+        """
+        if df.empty:
+            return df
+
+        for column_name in df.columns:
+            if not str(column_name).endswith(NUMERIC_COLUMN_SUFFIXES):
+                continue
+            original = df[column_name]
+            converted = pd.to_numeric(original, errors='coerce')
+            non_empty = original.notna() & (original != '')
+            if not (non_empty & converted.isna()).any():
+                df[column_name] = converted
+
+        return df
     
+    def _build_columnar_dataframe(self, data: List[Dict[str, Any]], iter_file_values) -> pd.DataFrame:
+        """
+        Shared two-pass dict-of-columns assembly for all export types
+
+        First pass collects the union of column names produced by
+        iter_file_values so every column can be pre-allocated; second pass
+        fills values by row index. Handing pandas a dict of equal-length
+        columns avoids the slow list-of-dicts construction path.
+
+        Args:
+            data: List of extracted data dictionaries
+            iter_file_values: Callable taking one file's data and yielding
+                              (column_name, value) pairs
+
+        Returns:
+            Assembled pandas DataFrame
+        """
+        row_count = len(data)
+        column_index = {'Filename': 0, 'Subject ID': 1}
+
+        for file_data in data:
+            for column_name, _ in iter_file_values(file_data):
+                if column_name not in column_index:
+                    column_index[column_name] = len(column_index)
+
+        # One Fortran-ordered object array: every column is a contiguous
+        # zero-copy 1-D view, so pandas skips block consolidation entirely
+        # (object arrays start out None-filled)
+        values = np.empty((row_count, len(column_index)), dtype=object, order='F')
+
+        for i, file_data in enumerate(data):
+            values[i, 0] = file_data.get('filename')
+            values[i, 1] = file_data.get('subject_id')
+            for column_name, value in iter_file_values(file_data):
+                values[i, column_index[column_name]] = value
+
+        return pd.DataFrame(values, columns=list(column_index), copy=False)
+
+    def warm_column_caches(self, data: List[Dict[str, Any]]) -> None:
+        """
+        Precompute formatted column names for a batch of extracted data
+
+        Lets a pipelined caller pay the column-name formatting cost while
+        later files are still being parsed; the builders then find every
+        (name, unit) pair already cached.
+
+        Args:
+            data: Batch of extracted data dictionaries
+        """
+        phase_columns = self._phase_column_cache
+        for file_data in data:
+            for param in file_data.get('parameters', []):
+                key = (param['Name'], param['UM'])
+                if key not in phase_columns:
+                    base_name = self._build_base_column_name(key[0], key[1])
+                    phase_columns[key] = tuple(f"{base_name}_{phase}" for phase in MEASUREMENT_PHASES)
+
     def _create_complete_dataframe(self, data: List[Dict[str, Any]]) -> pd.DataFrame:
         """Create DataFrame with all parameters and phases"""
-        rows = []
-        
-        for file_data in data:
-            # Start with basic file information
-            row = {
-                'Filename': file_data['filename'],
-                'Subject ID': file_data['subject_id'],
-                'File Path': file_data['file_path']
-            }
-            
-            # Add all parameters as columns
+        phase_columns = self._phase_column_cache
+
+        def iter_complete_values(file_data):
+            yield 'File Path', file_data['file_path']
             for param in file_data['parameters']:
-                param_name = param['Name']
-                unit = param['UM']
-                
-                # Create base column name
-                if unit and unit != "---":
-                    base_name = f"{param_name} ({unit})"
-                else:
-                    base_name = param_name
-                
-                # Add all measurement phases
-                phases = ['Value', 'Rest', 'Warmup', 'MFO', 'AT', 'RC', 'Max', 'Pred', 'PercPred', 'Normal', 'Class']
-                for phase in phases:
-                    column_name = f"{base_name}_{phase}"
-                    row[column_name] = param.get(phase)
-            
-            rows.append(row)
-        
-        return pd.DataFrame(rows)
+                key = (param['Name'], param['UM'])
+                names = phase_columns.get(key)
+                if names is None:
+                    base_name = self._build_base_column_name(key[0], key[1])
+                    names = tuple(f"{base_name}_{phase}" for phase in MEASUREMENT_PHASES)
+                    phase_columns[key] = names
+                for column_name, phase in zip(names, MEASUREMENT_PHASES):
+                    yield column_name, param.get(phase)
+
+        return self._build_columnar_dataframe(data, iter_complete_values)
+
+    def _build_base_column_name(self, param_name: str, unit: Optional[str]) -> str:
+        """Build base column name from parameter name and unit"""
+        if unit and unit != "---":
+            return f"{param_name} ({unit})"
+        return param_name
     
     def _create_selected_parameters_dataframe(self, data: List[Dict[str, Any]]) -> pd.DataFrame:
         """Create DataFrame with selected parameters only"""
-        # Define the 15 key selected parameters
-        selected_parameters = [
-            "t", "Speed", "Pace", "VO2", "VO2/kg", "VCO2", 
-            "METS", "RQ", "VE", "Rf", "HR", "VO2/HR"
-        ]
-        
-        rows = []
-        
-        for file_data in data:
-            row = {
-                'Filename': file_data['filename'],
-                'Subject ID': file_data['subject_id']
-            }
-            
-            # Add selected parameters only
+        selected_columns = self._selected_column_cache
+
+        def iter_selected_values(file_data):
             for param in file_data['parameters']:
                 param_name = param['Name']
-                unit = param['UM']
-                
-                # Only process if this is a selected parameter
-                if param_name in selected_parameters:
-                    # Create parameter columns for specific phases
-                    if unit and unit != "---":
-                        base_name = f"{param_name} ({unit})"
-                    else:
-                        base_name = param_name
-                    
-                    # Define phases based on parameter - VO2/kg gets all phases, others get Max only
-                    if param_name == 'VO2/kg':
-                        phases_to_include = ['MFO', 'AT', 'RC', 'Max']
-                    else:
-                        phases_to_include = ['Max']
-                    
-                    for phase in phases_to_include:
-                        if phase in param and param[phase] is not None:
-                            column_name = f"{base_name}_{phase}"
-                            row[column_name] = param[phase]
-            
-            rows.append(row)
-        
-        return pd.DataFrame(rows)
+                if param_name not in _SELECTED_PARAMETERS:
+                    continue
+
+                key = (param_name, param['UM'])
+                pairs = selected_columns.get(key)
+                if pairs is None:
+                    base_name = self._build_base_column_name(key[0], key[1])
+
+                    phases_to_include = SELECTED_PHASES_BY_PARAMETER.get(
+                        param_name, DEFAULT_SELECTED_PHASES)
+
+                    pairs = [(f"{base_name}_{phase}", phase) for phase in phases_to_include]
+                    selected_columns[key] = pairs
+
+                for column_name, phase in pairs:
+                    yield column_name, param.get(phase)
+
+        return self._build_columnar_dataframe(data, iter_selected_values)
     
     def _create_max_values_dataframe(self, data: List[Dict[str, Any]]) -> pd.DataFrame:
         """Create DataFrame with only Max values"""
-        rows = []
-        
-        for file_data in data:
-            row = {
-                'Filename': file_data['filename'],
-                'Subject ID': file_data['subject_id']
-            }
-            
-            # Add max parameters (already processed in data_extractor)
+
+        def iter_max_values(file_data):
+            # Max parameters already processed in data_extractor
             if 'max_parameters' in file_data:
-                row.update(file_data['max_parameters'])
-            else:
-                # Fallback: extract Max values from regular parameters
-                for param in file_data.get('parameters', []):
-                    param_name = param['Name']
-                    unit = param['UM']
-                    max_value = param.get('Max')
-                    
-                    if max_value is not None and max_value != '':
-                        if unit and unit != "---":
-                            column_name = f"{param_name} ({unit}) Max"
-                        else:
-                            column_name = f"{param_name} Max"
-                        row[column_name] = max_value
-            
-            rows.append(row)
-        
-        return pd.DataFrame(rows)
+                yield from file_data['max_parameters'].items()
+                return
+
+            # Fallback: extract Max values from regular parameters
+            for param in file_data.get('parameters', []):
+                max_value = param.get('Max')
+                if max_value is not None and max_value != '':
+                    base_name = self._build_base_column_name(param['Name'], param['UM'])
+                    yield f"{base_name} Max", max_value
+
+        return self._build_columnar_dataframe(data, iter_max_values)
     
     def _get_relevant_phases_for_parameter(self, param_name: str) -> List[str]:
         """
@@ -170,19 +273,78 @@ class ExcelFormatter:
             # Default phases for other parameters
             return ['MFO', 'AT', 'RC', 'Max']
     
-    def apply_excel_formatting(self, workbook: Workbook, worksheet_name: str = None) -> None:
+    def compact_low_cardinality_columns(self, df: pd.DataFrame, max_unique_ratio: float = 0.1) -> pd.DataFrame:
+        """
+        Convert heavily repeated string columns to pandas Categorical
+
+        Columns such as Class and Normal carry a handful of labels
+        repeated across every subject; storing them as categories keeps
+        one copy of each unique string plus integer codes, shrinking
+        DataFrame memory ahead of the workbook write.
+
+        Args:
+            df: Assembled DataFrame (modified in place)
+            max_unique_ratio: Convert a column when its unique count is
+                              below this fraction of the row count
+
+        Returns:
+            The DataFrame with low-cardinality columns converted
+        """
+        if df.empty:
+            return df
+
+        max_unique = len(df) * max_unique_ratio
+        for column_name in df.columns:
+            column = df[column_name]
+            if column.dtype == object and column.nunique() < max_unique:
+                df[column_name] = column.astype('category')
+
+        return df
+
+    def compute_column_widths(self, df: pd.DataFrame, max_width: int = 50) -> List[int]:
+        """
+        Compute display widths for DataFrame columns in one vectorized pass
+
+        Replaces the per-cell len(str(...)) worksheet walk: string lengths
+        are measured column-wise on the DataFrame, then bounded against the
+        header length and the width cap.
+
+        Args:
+            df: DataFrame that will be written
+            max_width: Upper bound for any column width
+
+        Returns:
+            List of widths, one per DataFrame column
+        """
+        header_lengths = [len(str(column)) for column in df.columns]
+        if df.empty:
+            return [min(length + 2, max_width) for length in header_lengths]
+
+        # Missing cells survive astype(str) as NaN, so blank them before
+        # measuring; all-NaN columns then fall back to the header width
+        content_lengths = (
+            df.astype(str).where(df.notna(), '').map(len).max(axis=0).tolist()
+        )
+        return [
+            min(max(int(content), header) + 2, max_width)
+            for content, header in zip(content_lengths, header_lengths)
+        ]
+
+    def apply_excel_formatting(self, workbook: Workbook, worksheet_name: str = None, df: Optional[pd.DataFrame] = None) -> None:
         """
         Apply professional formatting to Excel workbook
-        
+
         Args:
             workbook: Openpyxl workbook object
             worksheet_name: Name of worksheet to format (None for active)
+            df: Source DataFrame for the sheet; when given, column widths
+                are computed from it instead of walking every cell
         """
         if worksheet_name:
             ws = workbook[worksheet_name]
         else:
             ws = workbook.active
-        
+
         # Format headers
         if ws.max_row > 0:
             for cell in ws[1]:  # First row
@@ -190,14 +352,19 @@ class ExcelFormatter:
                 cell.fill = self.header_fill
                 cell.alignment = self.header_alignment
                 cell.border = self.border
-        
+
         # Apply borders to all data cells
         for row in ws.iter_rows(min_row=2, max_row=ws.max_row, max_col=ws.max_column):
             for cell in row:
                 cell.border = self.border
-        
-        # Auto-adjust column widths
-        self._auto_adjust_columns(ws)
+
+        # Adjust column widths - vectorized when the DataFrame is available
+        if df is not None:
+            from openpyxl.utils import get_column_letter
+            for col_idx, width in enumerate(self.compute_column_widths(df), start=1):
+                ws.column_dimensions[get_column_letter(col_idx)].width = width
+        else:
+            self._auto_adjust_columns(ws)
     
     def _auto_adjust_columns(self, worksheet) -> None:
         """Auto-adjust column widths based on content"""
@@ -267,28 +434,267 @@ class ExcelFormatter:
         # Auto-adjust columns
         self._auto_adjust_columns(ws)
     
-    def save_formatted_excel(self, data: List[Dict[str, Any]], file_path: str, data_type: str = "complete") -> None:
+    def save_formatted_excel(self, data: List[Dict[str, Any]], file_path: str, data_type: str = "complete",
+                             segment_size: Optional[int] = None) -> None:
         """
         Save data to formatted Excel file
-        
+
         Args:
             data: Extracted data
             file_path: Output file path
             data_type: Type of formatting to apply
+            segment_size: Optional maximum subjects per output file; when
+                the export exceeds it, numbered ``_part{k}`` files are
+                written instead of one oversized workbook
         """
+        # Beyond roughly a million rows a single xlsx stops being usable
+        # (write time scales linearly with rows and Excel struggles to
+        # open the result), so very large exports can be split into
+        # part files. Only string paths can be segmented.
+        if segment_size and len(data) > segment_size and isinstance(file_path, str):
+            root, ext = os.path.splitext(file_path)
+            for k, start in enumerate(range(0, len(data), segment_size), start=1):
+                self.save_formatted_excel(
+                    data[start:start + segment_size],
+                    f"{root}_part{k}{ext or '.xlsx'}",
+                    data_type,
+                )
+            return
+
         df = self.create_formatted_dataframe(data, data_type)
-        
+
+        # CSV bypasses the whole xlsx serialization stack; pandas' C
+        # writer emits the sheet directly (no styling or summary sheet
+        # in this format). File-like targets are always xlsx.
+        if isinstance(file_path, str) and file_path.lower().endswith('.csv'):
+            df.to_csv(file_path, index=False)
+            return
+
+        df = self.compact_low_cardinality_columns(df)
+
+        # The complete export can be very wide (every parameter x 11 phases);
+        # hand it to the fastest available writer. polars serializes the
+        # whole sheet natively, otherwise xlsxwriter streams it in
+        # constant-memory mode. Other export types keep the openpyxl path
+        # with full cell styling until they grow large enough that
+        # openpyxl's in-memory workbook becomes the bottleneck.
+        if data_type == "complete" or len(df) >= STREAMING_ROW_THRESHOLD:
+            if POLARS_AVAILABLE and XLSXWRITER_AVAILABLE:
+                self._save_with_polars(df, data, file_path)
+                return
+            if PYEXCELERATE_AVAILABLE:
+                self._save_with_pyexcelerate(df, data, file_path)
+                return
+            if XLSXWRITER_AVAILABLE:
+                self._save_with_xlsxwriter(df, data, file_path)
+                return
+            if len(df) >= STREAMING_ROW_THRESHOLD:
+                # Pure-stdlib direct ZIP+XML emission so large exports
+                # never fall back to openpyxl's in-memory workbook
+                self._save_with_fast_writer(df, data, file_path)
+                return
+            # Small complete export with none of the fast engines
+            # installed: keep the styled openpyxl output below
+
         # Create workbook with formatted data
         with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
             df.to_excel(writer, sheet_name='COSMED Data', index=False)
             workbook = writer.book
-            
+
             # Apply formatting
-            self.apply_excel_formatting(workbook, 'COSMED Data')
-            
+            self.apply_excel_formatting(workbook, 'COSMED Data', df=df)
+
             # Add summary sheet
             self.create_summary_sheet(workbook, data)
-    
+
+    def _save_with_polars(self, df: pd.DataFrame, data: List[Dict[str, Any]], file_path: str) -> None:
+        """
+        Save DataFrame via polars' native Excel writer
+
+        polars serializes the sheet without a Python call per cell and
+        handles column autofit internally, so the width computation loop
+        is skipped entirely. The summary sheet is added through the shared
+        xlsxwriter workbook.
+
+        Args:
+            df: DataFrame to save
+            data: Raw extracted data for the summary sheet
+            file_path: Output file path
+        """
+        workbook = xlsxwriter.Workbook(file_path, {'nan_inf_to_errors': True})
+        try:
+            pl.from_pandas(df).write_excel(
+                workbook=workbook,
+                worksheet='COSMED Data',
+                autofit=True,
+                header_format={
+                    'bold': True,
+                    'font_color': '#FFFFFF',
+                    'bg_color': '#366092',
+                    'align': 'center',
+                    'valign': 'vcenter',
+                    'border': 1
+                }
+            )
+            self._create_summary_sheet_xlsxwriter(workbook, data)
+        finally:
+            workbook.close()
+
+    def _save_with_pyexcelerate(self, df: pd.DataFrame, data: List[Dict[str, Any]], file_path: str) -> None:
+        """
+        Save DataFrame via pyexcelerate, the fastest pure-Python xlsx writer
+
+        pyexcelerate serializes a raw list-of-lists through templated XML
+        with minimal per-cell work; cell styling is skipped, which is
+        acceptable for the very wide complete export.
+
+        Args:
+            df: DataFrame to save
+            data: Raw extracted data for the summary sheet
+            file_path: Output file path
+        """
+        workbook = PyexcelerateWorkbook()
+        # NaN marks missing values after numeric coercion; emit blanks
+        sheet_rows = [[str(column) for column in df.columns]]
+        sheet_rows += df.astype(object).where(df.notna(), None).values.tolist()
+        workbook.new_sheet('COSMED Data', data=sheet_rows)
+        workbook.new_sheet('Summary', data=self._build_summary_rows(data))
+        workbook.save(file_path)
+
+    def _save_with_fast_writer(self, df: pd.DataFrame, data: List[Dict[str, Any]], file_path: str) -> None:
+        """
+        Save DataFrame via the stdlib FastXlsxWriter
+
+        Last streaming rung when no third-party fast engine is installed:
+        rows are deflated into the archive as they are rendered, so peak
+        memory stays at one row. No cell styling.
+
+        Args:
+            df: DataFrame to save
+            data: Raw extracted data for the summary sheet
+            file_path: Output file path
+        """
+        def iter_sheet_rows():
+            yield [str(column) for column in df.columns]
+            yield from df.itertuples(index=False)
+
+        FastXlsxWriter(file_path).write([
+            ('COSMED Data', iter_sheet_rows()),
+            ('Summary', self._build_summary_rows(data)),
+        ])
+
+    def _build_summary_rows(self, data: List[Dict[str, Any]]) -> List[List[Any]]:
+        """
+        Assemble the processing summary rows shared by the writer backends
+
+        Args:
+            data: Processed data for statistics
+
+        Returns:
+            List of [key, value] rows for the summary sheet
+        """
+        total_files = len(data)
+        subjects_with_id = sum(1 for item in data if item.get('subject_id'))
+        total_parameters = sum(len(item.get('parameters', [])) for item in data)
+        unique_parameters = set()
+
+        for item in data:
+            for param in item.get('parameters', []):
+                if param.get('Name'):
+                    unique_parameters.add(param['Name'])
+
+        summary_rows = [
+            ['Processing Summary', ''],
+            ['Total Files Processed', total_files],
+            ['Files with Subject ID', subjects_with_id],
+            ['Total Parameters Extracted', total_parameters],
+            ['Unique Parameter Types', len(unique_parameters)],
+            ['', ''],
+            ['Parameter Types Found', ''],
+        ]
+
+        for param_name in sorted(unique_parameters):
+            summary_rows.append([param_name, ''])
+
+        return summary_rows
+
+    def _save_with_xlsxwriter(self, df: pd.DataFrame, data: List[Dict[str, Any]], file_path: str) -> None:
+        """
+        Save DataFrame via xlsxwriter in constant-memory mode
+
+        Rows are flushed to disk as they are written, so peak memory stays
+        flat regardless of cohort size. Constant-memory mode requires rows
+        to be written strictly in order, so the header row is emitted first
+        and data rows are streamed afterwards.
+
+        Args:
+            df: DataFrame to save
+            data: Raw extracted data for the summary sheet
+            file_path: Output file path
+        """
+        workbook = xlsxwriter.Workbook(file_path, {
+            'constant_memory': True,
+            'strings_to_numbers': False,
+            'nan_inf_to_errors': True
+        })
+        try:
+            header_format = workbook.add_format({
+                'bold': True,
+                'font_color': '#FFFFFF',
+                'bg_color': '#366092',
+                'align': 'center',
+                'valign': 'vcenter',
+                'border': 1
+            })
+
+            worksheet = workbook.add_worksheet('COSMED Data')
+
+            # Column widths in one pass, computed from the DataFrame instead
+            # of walking every written cell
+            for col_idx, width in enumerate(self.compute_column_widths(df)):
+                worksheet.set_column(col_idx, col_idx, width)
+
+            # Header row first, then data rows in order (constant_memory
+            # forbids revisiting earlier rows)
+            worksheet.write_row(0, 0, [str(c) for c in df.columns], header_format)
+            for row_idx, row_values in enumerate(df.itertuples(index=False), start=1):
+                # NaN marks missing values after numeric coercion; write
+                # those cells blank rather than as #NUM! errors
+                worksheet.write_row(row_idx, 0, [None if value is None or value != value else value for value in row_values])
+
+            self._create_summary_sheet_xlsxwriter(workbook, data)
+        finally:
+            workbook.close()
+
+    def _create_summary_sheet_xlsxwriter(self, workbook, data: List[Dict[str, Any]], sheet_name: str = "Summary") -> None:
+        """
+        Create the processing summary sheet via the xlsxwriter API
+
+        Mirrors create_summary_sheet for the streaming write path.
+
+        Args:
+            workbook: xlsxwriter workbook object
+            data: Processed data for statistics
+            sheet_name: Name of summary sheet
+        """
+        worksheet = workbook.add_worksheet(sheet_name)
+
+        title_format = workbook.add_format({'bold': True, 'font_size': 14})
+        bold_format = workbook.add_format({'bold': True})
+
+        max_key_length = 0
+        for row_idx, (key, value) in enumerate(self._build_summary_rows(data)):
+            if row_idx == 0:
+                worksheet.write(row_idx, 0, key, title_format)
+            elif key == 'Parameter Types Found':
+                worksheet.write(row_idx, 0, key, bold_format)
+            else:
+                worksheet.write(row_idx, 0, key)
+            worksheet.write(row_idx, 1, value)
+            max_key_length = max(max_key_length, len(str(key)))
+
+        worksheet.set_column(0, 0, min(max_key_length + 2, 50))
+
     def get_column_mapping(self, data_type: str) -> Dict[str, str]:
         """
         Get column name mapping for different export types
@@ -332,60 +738,36 @@ class ExcelFormatter:
         """
         if not data:
             return pd.DataFrame()
-        
-        rows = []
-        
-        for file_data in data:
-            row = {
-                'Filename': file_data.get('filename', ''),
-                'Subject ID': file_data.get('subject_id', ''),
-            }
-            
-            # Get parameters data (it's a list of parameter dictionaries)
-            parameters_list = file_data.get('parameters', [])
-            
+
+        # Resolve the column layout once from the requested spec: a single
+        # phase keeps the bare parameter name, multiple phases get one
+        # column per phase
+        custom_columns = []  # (param_name, phase, column_name)
+        for param_name, phases in custom_parameters.items():
+            for phase in phases:
+                if len(phases) == 1:
+                    column_name = param_name
+                else:
+                    column_name = f"{param_name} - {phase}"
+                custom_columns.append((param_name, phase, column_name))
+
+        def iter_custom_values(file_data):
             # Convert parameters list to dictionary for easier access
             parameters_dict = {}
-            for param in parameters_list:
+            for param in file_data.get('parameters', []):
                 param_name = param.get('Name')
                 if param_name:
                     parameters_dict[param_name] = param
-            
-            # Add custom selected parameters and phases
-            for param_name, phases in custom_parameters.items():
-                if param_name in parameters_dict:
-                    param_data = parameters_dict[param_name]
-                    
-                    for phase in phases:
-                        if phase in param_data:
-                            # Create column name
-                            if len(phases) == 1:
-                                column_name = param_name
-                            else:
-                                column_name = f"{param_name} - {phase}"
-                            
-                            # Get the value from the parameter data
-                            value = param_data.get(phase, '')
-                            row[column_name] = value
-                        else:
-                            # Add empty value if phase not found
-                            if len(phases) == 1:
-                                column_name = param_name
-                            else:
-                                column_name = f"{param_name} - {phase}"
-                            row[column_name] = ''
+
+            for param_name, phase, column_name in custom_columns:
+                param_data = parameters_dict.get(param_name)
+                if param_data is not None and phase in param_data:
+                    yield column_name, param_data.get(phase, '')
                 else:
-                    # Add empty values if parameter not found
-                    for phase in phases:
-                        if len(phases) == 1:
-                            column_name = param_name
-                        else:
-                            column_name = f"{param_name} - {phase}"
-                        row[column_name] = ''
-            
-            rows.append(row)
-        
-        return pd.DataFrame(rows)
+                    # Empty value if parameter or phase not found
+                    yield column_name, ''
+
+        return self._build_columnar_dataframe(data, iter_custom_values)
     
     def save_custom_parameters_excel(self, data: List[Dict[str, Any]], file_path: str, custom_parameters: Dict[str, List[str]]) -> None:
         """
@@ -397,15 +779,20 @@ class ExcelFormatter:
             custom_parameters: Dictionary mapping parameter names to phases to export
         """
         df = self.create_custom_parameters_dataframe(data, custom_parameters)
-        
+
+        # CSV fast path, mirroring save_formatted_excel
+        if isinstance(file_path, str) and file_path.lower().endswith('.csv'):
+            df.to_csv(file_path, index=False)
+            return
+
         # Create workbook with formatted data
         with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
             df.to_excel(writer, sheet_name='COSMED Data', index=False)
             workbook = writer.book
-            
+
             # Apply formatting
-            self.apply_excel_formatting(workbook, 'COSMED Data')
-            
+            self.apply_excel_formatting(workbook, 'COSMED Data', df=df)
+
             # Add custom summary sheet
             self.create_custom_summary_sheet(workbook, data, custom_parameters)
     
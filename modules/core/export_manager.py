@@ -2,10 +2,14 @@
 Export Manager Module
 Manages different export operations and formats
 """
+import queue
+import threading
 import pandas as pd
 from typing import List, Dict, Any, Optional
 from .data_extractor import DataExtractor
-from .excel_formatter import ExcelFormatter
+from .excel_formatter import (
+    ExcelFormatter, SELECTED_PHASES_BY_PARAMETER, DEFAULT_SELECTED_PHASES
+)
 from ..utils.path_validator import PathValidator
 
 class ExportManager:
@@ -26,7 +30,10 @@ class ExportManager:
         "HR",                  # Heart rate in bpm
         "VO2/HR"               # Oxygen pulse in mL/beat
     ]
-    
+
+    # frozenset mirror for O(1) membership checks in per-parameter loops
+    _SELECTED_PARAMETER_SET = frozenset(SELECTED_PARAMETERS)
+
     def __init__(self):
         self.data_extractor = DataExtractor()
         self.excel_formatter = ExcelFormatter()
@@ -66,25 +73,24 @@ class ExportManager:
                     'Subject ID': file_data['subject_id']
                 }
                 
-                # Add selected parameters for specific phases
+                # Add selected parameters for specific phases; unwanted
+                # parameters are skipped before any name formatting
                 for param in file_data['parameters']:
                     param_name = param['Name']
+                    if param_name not in self._SELECTED_PARAMETER_SET:
+                        continue
+
                     unit = param['UM']
-                    
-                    if param_name in self.SELECTED_PARAMETERS:
-                        base_name = f"{param_name} ({unit})" if unit and unit != "---" else param_name
-                        
-                        # Define phases for each parameter based on requirements
-                        if param_name == 'VO2/kg':
-                            # VO2/kg needs MFO, AT, RC, and Max phases
-                            phases = ['MFO', 'AT', 'RC', 'Max']
-                        else:
-                            # All other parameters only need Max phase
-                            phases = ['Max']
-                        
-                        for phase in phases:
-                            if param.get(phase) is not None:
-                                row[f"{base_name}_{phase}"] = param[phase]
+                    base_name = f"{param_name} ({unit})" if unit and unit != "---" else param_name
+
+                    # Shared phase map keeps this layout in sync with
+                    # ExcelFormatter's selected-parameters DataFrame
+                    phases = SELECTED_PHASES_BY_PARAMETER.get(
+                        param_name, DEFAULT_SELECTED_PHASES)
+
+                    for phase in phases:
+                        if param.get(phase) is not None:
+                            row[f"{base_name}_{phase}"] = param[phase]
                 
                 rows.append(row)
             
@@ -175,9 +181,38 @@ class ExportManager:
             validated_dir = self.path_validator.validate_directory(input_directory)
             validated_output = self.path_validator.validate_file_path(output_file)
             
-            # Extract all data
-            extracted_data = self.data_extractor.extract_from_directory(validated_dir)
-            
+            # Producer/consumer pipeline: a background thread parses XML
+            # batches onto a bounded queue while this thread prepares the
+            # export column layout for each finished batch. The Excel
+            # writers need the full column union before serializing, so
+            # the overlap covers extraction and layout preparation.
+            batches: queue.Queue = queue.Queue(maxsize=2)
+            producer_errors: List[BaseException] = []
+
+            def produce():
+                try:
+                    for batch in self.data_extractor.iter_extraction_batches(validated_dir):
+                        batches.put(batch)
+                except BaseException as exc:
+                    producer_errors.append(exc)
+                finally:
+                    batches.put(None)
+
+            producer = threading.Thread(target=produce, daemon=True)
+            producer.start()
+
+            extracted_data = []
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    break
+                self.excel_formatter.warm_column_caches(batch)
+                extracted_data.extend(batch)
+
+            producer.join()
+            if producer_errors:
+                raise producer_errors[0]
+
             if not extracted_data:
                 return {
                     'success': False,
@@ -185,9 +220,9 @@ class ExportManager:
                     'files_processed': 0
                 }
             
-            # Create complete DataFrame
-            df = self.excel_formatter.create_formatted_dataframe(extracted_data, "complete")
-            self._save_with_formatting(df, validated_output, extracted_data, "Complete Dataset")
+            # Save through the formatter so the complete export picks the
+            # fastest available writer engine (polars/xlsxwriter/openpyxl)
+            self.excel_formatter.save_formatted_excel(extracted_data, validated_output, "complete")
             
             return {
                 'success': True,
@@ -270,7 +305,7 @@ class ExportManager:
             worksheet = workbook[sheet_name]
             
             # Apply formatting
-            self.excel_formatter.apply_excel_formatting(workbook, sheet_name)
+            self.excel_formatter.apply_excel_formatting(workbook, sheet_name, df=df)
             
             # Add summary sheet
             self.excel_formatter.create_summary_sheet(workbook, raw_data)
@@ -2,27 +2,58 @@
 XML Parser Module
 Handles XML parsing operations for COSMED data files
 """
+import mmap
 import xml.etree.ElementTree as ET
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 import logging
 
+try:
+    from lxml import etree as lxml_etree
+    LXML_AVAILABLE = True
+except ImportError:
+    lxml_etree = None
+    LXML_AVAILABLE = False
+
+# Document paths used for DOM-based lookups
+SUBJECT_PATH = ".//Subject"
+SUBJECT_ID_PATH = ".//Subject/ID"
+PARAMETERS_PATH = ".//AdditionalData/Parameters"
+
+# lxml XPath objects compile the path expression once at import time and
+# execute fully in C; ElementTree re-parses the path string on every find()
+if LXML_AVAILABLE:
+    _SUBJECT_XPATH = lxml_etree.XPath(SUBJECT_PATH)
+    _SUBJECT_ID_XPATH = lxml_etree.XPath(SUBJECT_ID_PATH + "/text()")
+    _PARAMETERS_XPATH = lxml_etree.XPath(PARAMETERS_PATH)
+
+# Attributes carried by each Parameter element, in output order
+PARAMETER_ATTRIBUTES = (
+    'Name', 'UM', 'Value', 'Rest', 'Warmup', 'MFO', 'AT',
+    'RC', 'Max', 'Pred', 'PercPred', 'Normal', 'Class'
+)
+
 class XmlParser:
     """XML parsing utilities for COSMED data files"""
-    
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-    
+
     def parse_file(self, file_path: str) -> Optional[ET.Element]:
         """
         Parse XML file and return root element
-        
+
+        Uses lxml's C parser when installed, falling back to the stdlib
+        ElementTree parser otherwise.
+
         Args:
             file_path: Path to XML file
-            
+
         Returns:
             Root element or None if parsing fails
         """
         try:
+            if LXML_AVAILABLE:
+                return lxml_etree.parse(file_path).getroot()
             tree = ET.parse(file_path)
             return tree.getroot()
         except ET.ParseError as e:
@@ -34,7 +65,102 @@ class XmlParser:
         except Exception as e:
             self.logger.error(f"Unexpected error parsing {file_path}: {e}")
             return None
-    
+
+    def stream_extract(self, file_path) -> Optional[Tuple[Optional[str], List[Dict[str, Any]], bool]]:
+        """
+        Extract subject ID and parameters in one streaming pass
+
+        Iterates the document with iterparse (lxml when installed) and
+        clears each element after it is consumed, so the full DOM is never
+        held in memory. Structure validation happens in the same pass.
+
+        Args:
+            file_path: Path to XML file, or a readable binary file-like
+                object to parse straight from memory
+
+        Returns:
+            Tuple of (subject_id, parameters, has_cosmed_structure),
+            or None if parsing fails
+        """
+        if LXML_AVAILABLE:
+            # huge_tree lifts libxml2's text-node size limits, which long
+            # numeric COSMED text nodes can otherwise trip
+            def iterparse(source, events):
+                return lxml_etree.iterparse(source, events=events, huge_tree=True)
+        else:
+            iterparse = ET.iterparse
+
+        subject_id: Optional[str] = None
+        parameters: List[Dict[str, Any]] = []
+        has_subject = False
+        has_parameters = False
+        tag_stack: List[str] = []
+
+        # Feed the parser from a read-only memory map so file bytes come
+        # straight from the page cache instead of buffered read() copies;
+        # empty or unmappable files fall back to the plain path. In-memory
+        # sources are handed to iterparse directly.
+        source = file_path
+        mapped = None
+        if isinstance(file_path, str):
+            try:
+                with open(file_path, 'rb') as file_obj:
+                    mapped = mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+                    source = mapped
+            except (OSError, ValueError):
+                mapped = None
+                source = file_path
+
+        try:
+            for event, elem in iterparse(source, events=('start', 'end')):
+                if event == 'start':
+                    tag_stack.append(elem.tag)
+                    continue
+
+                tag = elem.tag
+                if tag == 'ID' and len(tag_stack) >= 2 and tag_stack[-2] == 'Subject':
+                    if subject_id is None and elem.text:
+                        subject_id = elem.text.strip()
+                elif tag == 'Subject':
+                    has_subject = True
+                elif tag == 'Parameter' and len(tag_stack) >= 3 and tag_stack[-2] == 'Parameters' and tag_stack[-3] == 'AdditionalData':
+                    parameters.append(self.parse_parameter_element(elem))
+                elif tag == 'Parameters' and len(tag_stack) >= 2 and tag_stack[-2] == 'AdditionalData':
+                    has_parameters = True
+
+                tag_stack.pop()
+
+                # Free the consumed subtree; with lxml also drop already
+                # processed siblings so memory stays bounded. The root
+                # element has no parent (though a leading comment or PI
+                # makes getprevious() non-None), so skip it
+                elem.clear()
+                if LXML_AVAILABLE:
+                    parent = elem.getparent()
+                    if parent is not None:
+                        while elem.getprevious() is not None:
+                            del parent[0]
+
+            if not has_subject:
+                self.logger.warning("Missing Subject section in XML")
+            if not has_parameters:
+                self.logger.warning("Missing Parameters section in XML")
+
+            return subject_id, parameters, has_subject and has_parameters
+
+        except ET.ParseError as e:
+            self.logger.error(f"XML parsing error in {file_path}: {e}")
+            return None
+        except FileNotFoundError:
+            self.logger.error(f"File not found: {file_path}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Unexpected error parsing {file_path}: {e}")
+            return None
+        finally:
+            if mapped is not None:
+                mapped.close()
+
     def extract_subject_id(self, root: ET.Element) -> Optional[str]:
         """
         Extract subject ID from XML root element
@@ -46,7 +172,11 @@ class XmlParser:
             Subject ID or None if not found
         """
         try:
-            id_element = root.find(".//Subject/ID")
+            if LXML_AVAILABLE and isinstance(root, lxml_etree._Element):
+                texts = _SUBJECT_ID_XPATH(root)
+                return texts[0].strip() if texts and texts[0] else None
+
+            id_element = root.find(SUBJECT_ID_PATH)
             if id_element is not None and id_element.text:
                 return id_element.text.strip()
             return None
@@ -65,7 +195,11 @@ class XmlParser:
             Parameters section element or None if not found
         """
         try:
-            return root.find(".//AdditionalData/Parameters")
+            if LXML_AVAILABLE and isinstance(root, lxml_etree._Element):
+                sections = _PARAMETERS_XPATH(root)
+                return sections[0] if sections else None
+
+            return root.find(PARAMETERS_PATH)
         except Exception as e:
             self.logger.error(f"Error extracting parameters section: {e}")
             return None
@@ -80,21 +214,9 @@ class XmlParser:
         Returns:
             Dictionary containing parameter data
         """
-        return {
-            'Name': param_element.get('Name'),
-            'UM': param_element.get('UM'),
-            'Value': param_element.get('Value'),
-            'Rest': param_element.get('Rest'),
-            'Warmup': param_element.get('Warmup'),
-            'MFO': param_element.get('MFO'),
-            'AT': param_element.get('AT'),
-            'RC': param_element.get('RC'),
-            'Max': param_element.get('Max'),
-            'Pred': param_element.get('Pred'),
-            'PercPred': param_element.get('PercPred'),
-            'Normal': param_element.get('Normal'),
-            'Class': param_element.get('Class')
-        }
+        # One attrib lookup instead of thirteen .get() method dispatches
+        attrib = param_element.attrib
+        return {key: attrib.get(key) for key in PARAMETER_ATTRIBUTES}
     
     def validate_cosmed_structure(self, root: ET.Element) -> bool:
         """
@@ -108,9 +230,13 @@ class XmlParser:
         """
         try:
             # Check for essential COSMED elements
-            subject_section = root.find(".//Subject")
-            params_section = root.find(".//AdditionalData/Parameters")
-            
+            if LXML_AVAILABLE and isinstance(root, lxml_etree._Element):
+                subject_section = next(iter(_SUBJECT_XPATH(root)), None)
+                params_section = next(iter(_PARAMETERS_XPATH(root)), None)
+            else:
+                subject_section = root.find(SUBJECT_PATH)
+                params_section = root.find(PARAMETERS_PATH)
+
             if subject_section is None:
                 self.logger.warning("Missing Subject section in XML")
                 return False
@@ -151,10 +277,10 @@ class XmlParser:
                 info['subject_id'] = self.extract_subject_id(root)
                 info['has_cosmed_structure'] = self.validate_cosmed_structure(root)
                 
-                # Count parameters
+                # Count parameters lazily without materializing a list
                 params_section = self.extract_parameters_section(root)
                 if params_section is not None:
-                    info['parameter_count'] = len(params_section.findall("Parameter"))
+                    info['parameter_count'] = sum(1 for _ in params_section.iter("Parameter"))
                     
         except Exception as e:
             info['error'] = str(e)
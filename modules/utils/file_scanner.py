@@ -2,10 +2,22 @@
 File Scanner Module
 Handles file discovery and scanning operations
 """
+import codecs
 import os
 from typing import List, Dict, Any, Optional
 from .path_validator import PathValidator
 
+# Byte-order marks an XML document may legitimately start with, each with
+# the codec needed to read the markup that follows. UTF-32 marks must be
+# tested before UTF-16 (the UTF-32-LE BOM begins with the UTF-16-LE one)
+_XML_BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, 'utf-32-le'),
+    (codecs.BOM_UTF32_BE, 'utf-32-be'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+    (codecs.BOM_UTF8, 'utf-8'),
+)
+
 class FileScanner:
     """File scanning utilities for COSMED XML files"""
     
@@ -25,25 +37,34 @@ class FileScanner:
         """
         validated_dir = self.path_validator.validate_directory(directory)
         xml_files = []
-        
+
         if recursive:
-            # Walk through all subdirectories
-            for root, dirs, files in os.walk(validated_dir):
-                for filename in files:
-                    if self.path_validator.is_xml_file(filename):
-                        file_path = os.path.join(root, filename)
-                        xml_files.append(file_path)
+            # Iterative scandir traversal: DirEntry caches file type from
+            # the directory read, so no extra stat call per entry and no
+            # per-directory list materialization as with os.walk
+            pending_dirs = [validated_dir]
+            while pending_dirs:
+                current_dir = pending_dirs.pop()
+                try:
+                    with os.scandir(current_dir) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending_dirs.append(entry.path)
+                            elif self.path_validator.is_xml_file(entry.name) and entry.is_file():
+                                xml_files.append(entry.path)
+                except OSError:
+                    # Skip unreadable directories, matching os.walk behavior
+                    continue
         else:
             # Only scan the specified directory
             try:
-                for filename in os.listdir(validated_dir):
-                    if self.path_validator.is_xml_file(filename):
-                        file_path = os.path.join(validated_dir, filename)
-                        if os.path.isfile(file_path):
-                            xml_files.append(file_path)
+                with os.scandir(validated_dir) as entries:
+                    for entry in entries:
+                        if self.path_validator.is_xml_file(entry.name) and entry.is_file():
+                            xml_files.append(entry.path)
             except OSError as e:
                 raise ValueError(f"Error scanning directory: {e}")
-        
+
         return sorted(xml_files)  # Return sorted for consistent ordering
     
     def get_file_info(self, file_path: str) -> Dict[str, Any]:
@@ -186,30 +207,55 @@ class FileScanner:
     
     def validate_files_accessible(self, files: List[str]) -> Dict[str, List[str]]:
         """
-        Validate that all files are accessible
-        
+        Validate that all files are accessible and look like XML
+
         Args:
             files: List of file paths to validate
-            
+
         Returns:
-            Dictionary with 'accessible' and 'inaccessible' file lists
+            Dictionary with 'accessible', 'inaccessible' and
+            'invalid_content' file lists
         """
         accessible = []
         inaccessible = []
-        
+        invalid_content = []
+
         for file_path in files:
             try:
                 with open(file_path, 'rb') as f:
-                    # Try to read first byte to ensure file is accessible
-                    f.read(1)
-                accessible.append(file_path)
+                    # A fixed-size head is enough to tell markup from
+                    # arbitrary text, without decoding the whole file
+                    head = f.read(512)
             except (OSError, IOError, PermissionError):
                 inaccessible.append(file_path)
-        
+                continue
+
+            # Real XML starts with '<' (optionally after a BOM and
+            # whitespace); anything else would only fail later, inside
+            # the parser, after the full document has been read. BOM'd
+            # heads are decoded with their codec so UTF-16/32 documents,
+            # whose '<' is null-interleaved, pass the same check.
+            for bom, encoding in _XML_BOM_ENCODINGS:
+                if head.startswith(bom):
+                    looks_like_xml = (
+                        head[len(bom):].decode(encoding, errors='ignore')
+                        .lstrip().startswith('<')
+                    )
+                    break
+            else:
+                looks_like_xml = head.lstrip().startswith(b'<')
+
+            if looks_like_xml:
+                accessible.append(file_path)
+            else:
+                invalid_content.append(file_path)
+
         return {
             'accessible': accessible,
             'inaccessible': inaccessible,
+            'invalid_content': invalid_content,
             'total_count': len(files),
             'accessible_count': len(accessible),
-            'inaccessible_count': len(inaccessible)
+            'inaccessible_count': len(inaccessible),
+            'invalid_count': len(invalid_content)
         }
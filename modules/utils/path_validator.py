@@ -75,7 +75,9 @@ class PathValidator:
     @staticmethod
     def is_xml_file(file_path: str) -> bool:
         """Check if file has XML extension"""
-        return file_path.lower().endswith('.xml')
+        # Case-fold only the four suffix characters instead of copying
+        # the whole path through lower()
+        return file_path[-4:].lower() == '.xml'
     
     @staticmethod
     def is_excel_file(file_path: str) -> bool:
@@ -1,6 +1,8 @@
 """
 Refactored XML Data Reader using modular architecture
 """
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any, Optional
 from modules import DataExtractor, PathValidator, FileScanner, ErrorHandler, safe_execute
 
@@ -9,15 +11,18 @@ class XmlDataReader:
     This class reads XML data from files in a specified directory.
     """
     
-    def __init__(self, dir_path: str = None):
+    def __init__(self, dir_path: str = None, files: Optional[List[str]] = None):
         """
         Initialize XML Data Reader
-        
+
         Args:
             dir_path: Directory path containing XML files
+            files: Pre-scanned XML file paths; when given, extraction
+                   skips its own directory scan and uses these as-is
         """
         self.dir_path: Optional[str] = dir_path
-        
+        self.files: Optional[List[str]] = list(files) if files else None
+
         # Initialize modules
         self.data_extractor = DataExtractor()
         self.path_validator = PathValidator()
@@ -70,21 +75,37 @@ class XmlDataReader:
             self.error_handler.handle_exception(e, "read_data", "file_processing")
             raise
 
-    def extract_id_and_parameters(self) -> List[Dict[str, Any]]:
+    def extract_id_and_parameters(self, progress_callback=None, progress_batch_size: int = 8) -> List[Dict[str, Any]]:
         """
         Extract ID and all parameters with their values from XML files
-        
+
+        Args:
+            progress_callback: Optional callable invoked with the running
+                number of extracted files as each parallel batch completes
+            progress_batch_size: Files per progress update; small enough
+                that the callback fires repeatedly even for modest folders
+
         Returns:
             List of dictionaries containing extracted data for each XML file
         """
         self._validate_directory_path()
-        
+
         try:
             self.error_handler.log_info(f"Starting extraction from directory: {self.dir_path}", "extract_id_and_parameters")
-            
-            # Use the data extractor module
-            extracted_data = self.data_extractor.extract_from_directory(self.dir_path)
-            
+
+            # Use the data extractor module; when a progress callback is
+            # given, consume the parallel extraction in small batches so
+            # the caller can report progress while workers parse, instead
+            # of one update after everything has finished
+            if progress_callback is None:
+                extracted_data = self.data_extractor.extract_from_directory(self.dir_path, files=self.files)
+            else:
+                extracted_data = []
+                for batch in self.data_extractor.iter_extraction_batches(
+                        self.dir_path, batch_size=progress_batch_size, files=self.files):
+                    extracted_data.extend(batch)
+                    progress_callback(len(extracted_data))
+
             # Log success
             self.error_handler.log_info(f"Successfully extracted data from {len(extracted_data)} files", "extract_id_and_parameters")
             
@@ -94,6 +115,28 @@ class XmlDataReader:
             self.error_handler.handle_exception(e, "extract_id_and_parameters", "extraction_error")
             raise
 
+    def iter_subjects(self):
+        """
+        Lazily yield one extracted subject record per XML file
+
+        Generator counterpart to extract_id_and_parameters: files are
+        parsed in parallel batches but records are handed out one at a
+        time, so callers can overlap parsing with their own per-subject
+        work instead of waiting for the whole directory.
+
+        Yields:
+            Extraction dictionaries in the same shape as
+            extract_id_and_parameters
+        """
+        self._validate_directory_path()
+
+        try:
+            for batch in self.data_extractor.iter_extraction_batches(self.dir_path, files=self.files):
+                yield from batch
+        except Exception as e:
+            self.error_handler.handle_exception(e, "iter_subjects", "extraction_error")
+            raise
+
     def _validate_directory_path(self):
         """Validate directory path using modular validator"""
         if not self.dir_path:
@@ -131,7 +174,9 @@ class XmlDataReader:
                 'total_size': scan_summary['total_size'],
                 'accessible_files': accessibility['accessible_count'],
                 'inaccessible_files': accessibility['inaccessible_count'],
-                'validation_success': accessibility['inaccessible_count'] == 0,
+                'invalid_content_files': accessibility['invalid_count'],
+                'validation_success': accessibility['inaccessible_count'] == 0
+                                      and accessibility['invalid_count'] == 0,
                 'scan_errors': scan_summary.get('scan_error'),
                 'file_details': accessibility
             }
@@ -140,6 +185,53 @@ class XmlDataReader:
             self.error_handler.handle_exception(e, "validate_files", "validation_error")
             raise
     
+    def extract_parameter_names(self, file_paths: Optional[List[str]] = None, limit: int = 3) -> List[str]:
+        """
+        Sample a few XML files and return the union of their parameter names
+
+        Cheap alternative to extract_id_and_parameters when only the
+        parameter catalogue is needed (e.g. populating a selection UI):
+        only `limit` files are parsed, concurrently, since lxml/expat
+        release the GIL while parsing.
+
+        Args:
+            file_paths: XML files to sample (defaults to a directory scan)
+            limit: Maximum number of files to parse (0 means all)
+
+        Returns:
+            Sorted list of unique parameter names found in the sample
+        """
+        if file_paths is None:
+            self._validate_directory_path()
+            file_paths = self.file_scanner.find_xml_files(self.dir_path)
+
+        sample_files = file_paths[:limit] if limit else file_paths
+        if not sample_files:
+            return []
+
+        names = set()
+        max_workers = min(len(sample_files), os.cpu_count() or 1)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.data_extractor.extract_from_file, file_path)
+                for file_path in sample_files
+            ]
+            for future in as_completed(futures):
+                try:
+                    file_data = future.result()
+                except Exception as e:
+                    self.error_handler.handle_exception(e, "extract_parameter_names", "parse_error")
+                    continue
+                if file_data:
+                    # set.update with a generator keeps the accumulation in
+                    # C instead of a per-parameter .add() call
+                    names.update(
+                        param['Name'] for param in file_data['parameters'] if param['Name']
+                    )
+
+        return sorted(names)
+
     def get_available_parameters(self) -> List[str]:
         """Get list of all unique parameter names available in XML files"""
         if not self.dir_path: